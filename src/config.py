@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import json
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from pydantic import (
     BaseModel,
@@ -182,6 +182,10 @@ class Settings(BaseSettings):
         default=15,
         validation_alias=AliasChoices("INGEST_INTERVAL_MIN", "ingest_interval_min"),
     )
+    INGEST_CONCURRENCY: int = Field(
+        default=8,
+        validation_alias=AliasChoices("INGEST_CONCURRENCY", "ingest_concurrency"),
+    )
     INGEST_CRON: str = Field(
         default="*/15 * * * *",
         validation_alias=AliasChoices("INGEST_CRON", "ingest_cron"),
@@ -197,6 +201,17 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("REMOTE_BLOCK_HOSTS", "remote_block_hosts"),
     )
 
+    # ---- Installs ----
+    DOWNLOAD_CHUNK_SIZE: int = Field(
+        default=1024 * 1024,
+        validation_alias=AliasChoices("MATRIX_DOWNLOAD_CHUNK", "DOWNLOAD_CHUNK_SIZE", "download_chunk_size"),
+    )
+
+    LOCKFILE_FSYNC: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("MATRIX_LOCKFILE_FSYNC", "LOCKFILE_FSYNC", "lockfile_fsync"),
+    )
+
     # ---- Tenancy ----
     TENANCY_MODE: TenancyMode = Field(
         default=TenancyMode.single,
@@ -317,3 +332,36 @@ try:
     settings = Settings()  # type: ignore[call-arg]
 except ValidationError as ve:
     raise RuntimeError(f"Invalid configuration: {ve}") from ve
+
+
+# ---- Hot-path bindings ----
+# Modules on the request path copy a few settings into module globals at
+# import time. They register a binder here so `reload_settings()` can refresh
+# those copies after the environment changes (tests, admin tooling).
+_reload_hooks: List[Callable[[], None]] = []
+
+
+def on_settings_reload(fn: Callable[[], None]) -> Callable[[], None]:
+    """Register `fn` to re-bind values cached from `settings`; runs it once now."""
+    _reload_hooks.append(fn)
+    fn()
+    return fn
+
+
+def reload_settings() -> Settings:
+    """
+    Re-read the environment and re-run the registered binders.
+
+    Snapshot contract: `settings` stays the same object, so modules that did
+    `from src.config import settings` and read attributes at call time see the
+    new values. Values copied out of it (module globals, closures) are
+    snapshots and only change if their module registered a binder with
+    `on_settings_reload`. The new values are validated as a fresh `Settings()`
+    first; if that raises, `settings` is left untouched.
+    """
+    fresh = Settings()  # type: ignore[call-arg]
+    settings.__dict__.update(fresh.__dict__)
+    object.__setattr__(settings, "__pydantic_fields_set__", set(fresh.model_fields_set))
+    for fn in _reload_hooks:
+        fn()
+    return settings
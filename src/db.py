@@ -26,6 +26,7 @@ from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from src.config import settings
 from src.models import Entity  # ensure models module is on PYTHONPATH
@@ -41,11 +42,12 @@ SessionLocal: sessionmaker[Session] = sessionmaker(class_=Session, future=True)
 SessionRead: sessionmaker[Session] = sessionmaker(class_=Session, future=True)
 
 
-def _build_engine(url: str) -> Engine:
+def _build_engine(url: str, **overrides) -> Engine:
     """Create a SQLAlchemy engine using project settings.
 
     Applies SQLite-specific connect args when needed and configures PRAGMAs on connect
-    so dev instances remain responsive during writes.
+    so dev instances remain responsive during writes. `overrides` are passed to
+    create_engine as-is (e.g. poolclass=NullPool for background workers).
     """
     connect_args: dict = {}
     if url.startswith(("sqlite://", "sqlite:///")):
@@ -57,13 +59,14 @@ def _build_engine(url: str) -> Engine:
         "connect_args": connect_args,
         "future": True,
     }
-    if not url.startswith("sqlite"):
+    if not url.startswith("sqlite") and "poolclass" not in overrides:
         # Only meaningful for real RDBMS drivers (e.g., Postgres)
         engine_kwargs.update(
             pool_size=getattr(settings, "DB_POOL_SIZE", 10),
             max_overflow=getattr(settings, "DB_MAX_OVERFLOW", 20),
         )
 
+    engine_kwargs.update(overrides)
     engine = create_engine(url, **engine_kwargs)
 
     # SQLite: enable WAL + sane defaults so readers don't block during writes
@@ -172,6 +175,28 @@ def init_db() -> None:
         raise
 
 
+def create_background_engine() -> Engine:
+    """
+    Dedicated, unpooled engine for background jobs (scheduled ingest). Keeps
+    long-running work from holding connections of the request pool, and
+    skips pre-ping since every checkout is a fresh connection anyway. The
+    caller owns it and disposes it when the job runner stops.
+    """
+    return _build_engine(settings.DATABASE_URL, poolclass=NullPool, pool_pre_ping=False)
+
+
+def create_background_sessionmaker(engine: Engine) -> sessionmaker[Session]:
+    """Session factory for background jobs on `engine` (see create_background_engine)."""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=engine,
+        future=True,
+        class_=Session,
+        expire_on_commit=False,
+    )
+
+
 def close_db() -> None:
     """Dispose of engines and reset globals (called on app shutdown)."""
     global _engine, _engine_ro, SessionLocal, SessionRead, _schema_ready
@@ -44,6 +44,7 @@ from ..services.search import (  # type: ignore
 # for `pgtrgm` because src/services/search/backends/pgtrgm.py only exports a
 # module-level `search()` function (no `PGTrgmBackend` class).
 from ..services.search import engine
+from ..services.search.interfaces import Hit
 
 # Optional RAG and reranker (guarded)
 try:  # pragma: no cover
@@ -218,7 +219,7 @@ def _search_catalog_impl(
     # to NullLexicalBackend when the configured backend module fails to
     # expose a class (the pgtrgm backend only exports a module-level
     # `search()` function).
-    lex_hits: List[Dict[str, Any]] = []
+    lex_hits: List[Hit] = []
     if mode != schemas.SearchMode.semantic:
         lex_hits = engine.run_keyword(
             db=db,
@@ -230,7 +231,7 @@ def _search_catalog_impl(
         )
 
     # Vector (ANN) unless keyword-only — restore v0.1.4 behavior
-    vec_hits: List[Dict[str, Any]] = []
+    vec_hits: List[Hit] = []
     if mode != schemas.SearchMode.keyword:
         q_vec = embedder.encode([q])[0]
         vec_kwargs = dict(base_filters)
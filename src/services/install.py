@@ -30,7 +30,7 @@ import subprocess
 import sys
 import tempfile
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Union
@@ -49,6 +49,11 @@ try:
 except Exception:  # pragma: no cover
     write_adapters = None  # type: ignore
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 # Gateway helpers (these are wrappers around the new MCPGatewayClient)
 try:
     from .gateway_client import (  # type: ignore
@@ -144,6 +149,26 @@ class StepResult:
     extra: Dict[str, Any] = None  # populated ad-hoc per step
 
 
+def _step_to_dict(r: StepResult) -> Dict[str, Any]:
+    """
+    Flat dict for a StepResult (same keys as dataclasses.asdict, without its
+    recursive deep-copy walk; results are freshly built so sharing `extra`
+    is safe).
+    """
+    extra = r.extra
+    if is_dataclass(extra) and not isinstance(extra, type):
+        extra = asdict(extra)
+    return {
+        "step": r.step,
+        "ok": r.ok,
+        "returncode": r.returncode,
+        "stdout": r.stdout,
+        "stderr": r.stderr,
+        "elapsed_secs": r.elapsed_secs,
+        "extra": extra,
+    }
+
+
 # --------------------------------------------------------------------------------------
 # Public API
 # --------------------------------------------------------------------------------------
@@ -362,7 +387,7 @@ def install_entity(
     # Shape response
     return {
         "plan": plan,
-        "results": [asdict(r) for r in results],
+        "results": [_step_to_dict(r) for r in results],
         "files_written": files_written,
         "lockfile": lockfile_data,
     }
@@ -492,20 +517,42 @@ def _pip_cmd_preview(pkg: str, ver: str) -> str:
 # Artifact installers
 # --------------------------------------------------------------------------------------
 
-def _install_pypi(spec: Dict[str, Any]) -> StepResult:
+def _pypi_requirement(spec: Dict[str, Any]) -> str:
+    """'pkg' + optional version specifier (e.g. '==1.4.2' or '>=1.0,<2'); '' if no package."""
     pkg = (spec.get("package") or "").strip()
-    ver = (spec.get("version") or "").strip()  # e.g. "==1.4.2" or ">=1.0,<2"
+    ver = (spec.get("version") or "").strip()
     if not pkg:
-        return StepResult(step="pypi", ok=False, stderr="missing spec.package")
+        return ""
+    return f"{pkg}{ver}" if ver else pkg
 
-    pkg_spec = f"{pkg}{ver}" if ver else pkg
 
+def _pip_install_cmd(requirements: List[str]) -> List[str]:
     if shutil.which("uv"):
-        cmd = ["uv", "pip", "install", "--system", "--no-cache-dir", pkg_spec]
-    else:
-        cmd = [sys.executable, "-m", "pip", "install", "--no-cache-dir", pkg_spec]
+        return ["uv", "pip", "install", "--system", "--no-cache-dir", *requirements]
+    return [sys.executable, "-m", "pip", "install", "--no-cache-dir", *requirements]
+
+
+def _install_pypi(spec: Dict[str, Any]) -> StepResult:
+    pkg_spec = _pypi_requirement(spec)
+    if not pkg_spec:
+        return StepResult(step="pypi", ok=False, stderr="missing spec.package")
+
+    return _run_cmd("pypi", _pip_install_cmd([pkg_spec]), timeout=1800)
+
+
+def _install_pypi_batch(specs: Iterable[Dict[str, Any]]) -> StepResult:
+    """
+    Install several pypi specs with one pip/uv invocation (one resolver run,
+    one interpreter start). Duplicate requirements are dropped, order kept.
+    The single StepResult lists the requirements in extra["packages"].
+    """
+    reqs = list(dict.fromkeys(r for r in map(_pypi_requirement, specs) if r))
+    if not reqs:
+        return StepResult(step="pypi", ok=False, stderr="missing spec.package")
 
-    return _run_cmd("pypi", cmd, timeout=1800)
+    res = _run_cmd("pypi", _pip_install_cmd(reqs), timeout=1800)
+    res.extra = {**(res.extra or {}), "packages": reqs}
+    return res
 
 
 def _install_oci(spec: Dict[str, Any]) -> StepResult:
@@ -577,15 +624,27 @@ def _install_zip(spec: Dict[str, Any], target_dir: Path) -> StepResult:
     dest.mkdir(parents=True, exist_ok=True)
 
     start = time.perf_counter()
+    tmp_path: Optional[Path] = None
     try:
-        with httpx.Client(timeout=60.0) as c:
-            r = c.get(url)
-            r.raise_for_status()
-            content = r.content
-        if digest:
-            algo, _, hexval = digest.partition(":")
-            algo = (algo or "sha256").lower()
-            computed = hashlib.new(algo, content).hexdigest()
+        algo, _, hexval = digest.partition(":") if digest else ("", "", "")
+        algo = (algo or "sha256").lower()
+        hasher = hashlib.new(algo) if digest else None
+        chunk_size = max(int(settings.DOWNLOAD_CHUNK_SIZE or 0), 64 * 1024)
+
+        # Stream to a temp file in large chunks, hashing as we go, so the
+        # archive is never held in memory in full.
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
+            tmp_path = Path(tmp.name)
+            with httpx.Client(timeout=60.0) as c:
+                with c.stream("GET", url) as r:
+                    r.raise_for_status()
+                    for chunk in r.iter_bytes(chunk_size=chunk_size):
+                        tmp.write(chunk)
+                        if hasher is not None:
+                            hasher.update(chunk)
+
+        if hasher is not None:
+            computed = hasher.hexdigest()
             if computed.lower() != (hexval or "").lower():
                 return StepResult(
                     step="zip",
@@ -593,20 +652,19 @@ def _install_zip(spec: Dict[str, Any], target_dir: Path) -> StepResult:
                     stderr=f"digest mismatch: expected {digest}, got {algo}:{computed}",
                     elapsed_secs=time.perf_counter() - start,
                 )
-        # Write temp and unzip
+        # Unzip
         import zipfile
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
         with zipfile.ZipFile(tmp_path, "r") as zf:
             zf.extractall(dest)
-        tmp_path.unlink(missing_ok=True)
         return StepResult(
             step="zip", ok=True, elapsed_secs=time.perf_counter() - start, extra={"path": str(dest)}
         )
     except Exception as e:
         log.exception("zip install failed")
         return StepResult(step="zip", ok=False, stderr=str(e), elapsed_secs=time.perf_counter() - start)
+    finally:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
 
 
 # --------------------------------------------------------------------------------------
@@ -751,10 +809,28 @@ def _build_lockfile(entity: Entity, manifest: Dict[str, Any], artifacts: List[Di
     }
 
 
+def _lockfile_bytes(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
 def _write_lockfile(target_dir: Path, data: Dict[str, Any]) -> Path:
     lf = target_dir / "matrix.lock.json"
-    # Merge if exists: naive overwrite for MVP
-    lf.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    # Merge if exists: naive overwrite for MVP.
+    # One serialized buffer, one write; the lockfile is regenerable, so it is
+    # only fsync'ed when LOCKFILE_FSYNC is enabled.
+    buf = _lockfile_bytes(data)
+    with open(lf, "wb") as f:  # BufferedWriter.write always writes the whole buffer
+        f.write(buf)
+        if settings.LOCKFILE_FSYNC:
+            f.flush()
+            os.fsync(f.fileno())
     return lf
 
 
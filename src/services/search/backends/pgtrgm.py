@@ -6,7 +6,9 @@ Lexical backend using Postgres pg_trgm similarity, with a portable fallback.
 - Fallback (SQLite/other): naive LIKE ranking for development to avoid hard failures.
 
 Filters (type, capabilities, frameworks, providers) are applied in Python after
-retrieval to keep SQL portable across engines.
+retrieval to keep SQL portable across engines. The READY predicate
+(`filters["ready_only"]`) is the exception: it is pushed into the query so
+non-registered entities never count against the candidate limit.
 """
 
 from __future__ import annotations
@@ -27,17 +29,26 @@ from ..util import (
 )
 
 
+# Callers (engine.run_pgtrgm) check this before skipping their own READY pass.
+SUPPORTS_READY_FILTER = True
+
+
 def _is_postgres(engine: Engine) -> bool:
     name = (engine.dialect.name or "").lower()
     return name == "postgresql"
 
 
-def _fetch_candidates_pg(db: Session, q: str, k: int) -> List[dict]:
+def _fetch_candidates_pg(db: Session, q: str, k: int, ready_only: bool = False) -> List[dict]:
     """
     Use pg_trgm similarity across name/summary/description; pick the max per row.
     """
+    ready_sql = (
+        "AND e.gateway_registered_at IS NOT NULL AND e.gateway_error IS NULL"
+        if ready_only
+        else ""
+    )
     sql = text(
-        """
+        f"""
         SELECT
           e.uid,
           e.type,
@@ -56,6 +67,7 @@ def _fetch_candidates_pg(db: Session, q: str, k: int) -> List[dict]:
           ) as sim
         FROM entity e
         WHERE (e.name ILIKE :ilq OR e.summary ILIKE :ilq OR e.description ILIKE :ilq)
+          {ready_sql}
         ORDER BY sim DESC
         LIMIT :limit
         """
@@ -64,37 +76,37 @@ def _fetch_candidates_pg(db: Session, q: str, k: int) -> List[dict]:
     return [dict(r) for r in rows]
 
 
-def _fetch_candidates_fallback(db: Session, q: str, k: int) -> List[dict]:
+def _fetch_candidates_fallback(db: Session, q: str, k: int, ready_only: bool = False) -> List[dict]:
     """
     Portable fallback for engines without pg_trgm. Gives a crude score:
     count of case-insensitive matches across fields / 3.
     """
     q_l = q.lower()
-    rows = (
-        db.query(
-            Entity.uid,
-            Entity.type,
-            Entity.name,
-            Entity.version,
-            Entity.summary,
-            Entity.capabilities,
-            Entity.frameworks,
-            Entity.providers,
-            Entity.quality_score,
-            Entity.release_ts,
-            Entity.created_at,
-        )
-        .all()
+    query = db.query(
+        Entity.uid,
+        Entity.type,
+        Entity.name,
+        Entity.version,
+        Entity.summary,
+        Entity.capabilities,
+        Entity.frameworks,
+        Entity.providers,
+        Entity.quality_score,
+        Entity.release_ts,
+        Entity.created_at,
     )
+    if ready_only:
+        query = query.filter(
+            Entity.gateway_registered_at.isnot(None),
+            Entity.gateway_error.is_(None),
+        )
+    rows = query.all()
 
     scored: List[dict] = []
     for r in rows:
-        name = (r.name or "").lower()
-        summary = (r.summary or "").lower()
-        # We don't have description here; keep it simple for fallback
-        hits = 0
-        hits += 1 if q_l in name else 0
-        hits += 1 if q_l in summary else 0
+        # We don't have description here; keep it simple for fallback.
+        # bools add as 0/1, so the match count needs no branches.
+        hits = (q_l in (r.name or "").lower()) + (q_l in (r.summary or "").lower())
         score = hits / 2.0  # crude score in [0,1]
         scored.append(
             dict(
@@ -121,10 +133,11 @@ def search(q: str, filters: Dict, k: int, db: Session) -> List[Hit]:
     Return lexical hits with normalized similarity (0..1), basic quality/recency.
     """
     engine = db.get_bind()
+    ready_only = bool(filters.get("ready_only"))
     if _is_postgres(engine):
-        candidates = _fetch_candidates_pg(db, q, k)
+        candidates = _fetch_candidates_pg(db, q, k, ready_only)
     else:
-        candidates = _fetch_candidates_fallback(db, q, k)
+        candidates = _fetch_candidates_fallback(db, q, k, ready_only)
 
     # Apply filters in Python (portable across engines)
     f_type = (filters.get("type") or "").strip()
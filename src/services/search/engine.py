@@ -1,17 +1,18 @@
 # src/services/search/engine.py
 from __future__ import annotations
 
+from itertools import islice
 from typing import List, Optional, Dict
 
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from src.config import settings
+from src.config import on_settings_reload, settings
 from src.models import Entity
 
 from .interfaces import Hit
 from .util import compute_recency_score, normalize_minmax
-from .lexical_none import search_like
+from .lexical_none import search_like_scored
 
 # Try to load the pg_trgm backend (prod path). Safe if unavailable in dev.
 try:
@@ -20,26 +21,37 @@ except Exception:  # pragma: no cover
     pgtrgm_backend = None  # type: ignore
 
 
+_LEXICAL_BACKEND = "none"
+
+
+@on_settings_reload
+def _bind_settings() -> None:
+    global _LEXICAL_BACKEND
+    _LEXICAL_BACKEND = (getattr(settings, "SEARCH_LEXICAL_BACKEND", None) or "none").lower()
+
+
+# Extra rows requested from pg_trgm to absorb non-READY entities, and how many
+# times the request is widened (k doubled) when the filter still leaves a gap.
+_READY_SLACK = 16
+_READY_RETRIES = 2
+
+
 def _filter_ready_hits(db: Session, hits: List[Hit]) -> List[Hit]:
     """
     READY-only filter: keep hits whose entities have gateway_registered_at set and no gateway_error.
-    No-ops if hits is empty.
+    No-ops if hits is empty. Only needed for lexical backends that cannot
+    apply the READY predicate themselves (no SUPPORTS_READY_FILTER).
     """
     if not hits:
         return hits
 
-    ids = [h.entity_id for h in hits]
+    ids = {h.entity_id for h in hits}
     rows = (
         db.query(Entity.uid, Entity.gateway_registered_at, Entity.gateway_error)
-        .filter(Entity.uid.in_(ids))
+        .filter(Entity.uid.in_(tuple(ids)))
         .all()
     )
-    ready_ids = {
-        r.uid
-        for r in rows
-        if (getattr(r, "gateway_registered_at", None) is not None)
-        and (getattr(r, "gateway_error", None) is None)
-    }
+    ready_ids = {uid for uid, reg, err in rows if reg is not None and err is None}
     return [h for h in hits if h.entity_id in ready_ids]
 
 
@@ -53,6 +65,12 @@ def _ready_filter_query(qb, include_pending: bool):
     return qb
 
 
+def _looks_like_uid(q: Optional[str]) -> bool:
+    """True when q has the full 'type:name@version' UID shape."""
+    qn = (q or "").strip()
+    return ":" in qn and "@" in qn
+
+
 def _fallback_uid_or_slug_hit(
     db: Session,
     q: str,
@@ -72,9 +90,10 @@ def _fallback_uid_or_slug_hit(
         return []
 
     ql = qn.lower()
-    qb = db.query(Entity)
+    # Only the columns the Hit needs; skips hydrating description/manifests.
+    qb = db.query(Entity.uid, Entity.release_ts, Entity.created_at, Entity.quality_score)
 
-    if ":" in ql and "@" in ql:
+    if _looks_like_uid(ql):
         qb = qb.filter(func.lower(Entity.uid) == ql)
     else:
         qb = qb.filter(func.lower(Entity.uid).like(f"%:{ql}@%"))
@@ -83,17 +102,18 @@ def _fallback_uid_or_slug_hit(
         qb = qb.filter(Entity.type.in_(types))
 
     qb = _ready_filter_query(qb, include_pending)
-    ent = qb.order_by(Entity.created_at.desc()).first()
-    if not ent:
+    row = qb.order_by(Entity.created_at.desc()).first()
+    if not row:
         return []
 
-    ts = ent.release_ts or ent.created_at
+    uid, release_ts, created_at, quality_score = row
+    ts = release_ts or created_at
     return [
         Hit(
-            entity_id=ent.uid,
+            entity_id=uid,
             score=1.0,                 # lead when user typed an exact/slug id
             source="lexical",          # <-- IMPORTANT: ensure ranker doesn't drop it
-            quality=float(ent.quality_score or 0.0),
+            quality=float(quality_score or 0.0),
             recency=compute_recency_score(ts),
         )
     ]
@@ -114,33 +134,50 @@ def run_pgtrgm(
     if pgtrgm_backend is None:
         return []
 
+    # A pasted full UID ("agent:foo@1.2.3") resolves via one indexed uid probe;
+    # only fall through to the trigram scan when that probe misses.
+    uid_probed = _looks_like_uid(q)
+    if uid_probed:
+        exact = _fallback_uid_or_slug_hit(db, q, types, include_pending)
+        if exact:
+            return exact if not offset else []
+
     # Build backend filters (pgtrgm backend expects a single 'type' value, not a list)
     filters: Dict = {
         "type": (types[0] if types else None) or "",
         "capabilities": [],
         "frameworks": [],
         "providers": [],
+        "ready_only": not include_pending,
     }
+    # Older backends ignore "ready_only"; keep the post-filter for them.
+    post_filter = not include_pending and not getattr(
+        pgtrgm_backend, "SUPPORTS_READY_FILTER", False
+    )
 
-    # k is the top-k target (backend expands internally)
-    k = max(int(limit), 1)
-
-    try:
-        hits: List[Hit] = pgtrgm_backend.search(q=q, filters=filters, k=k, db=db)
-    except Exception:
-        # Defensive: never let backend errors bubble up to the route
-        hits = []
-
-    if not include_pending:
-        hits = _filter_ready_hits(db, hits)
-
-    # Offset handling (cheap slice); pg_trgm backend doesn't support offset natively
-    if offset:
-        hits = hits[offset:]
-    hits = hits[:limit]
-
-    # If nothing matched via normal lexical fields, try a single UID/slug fallback.
-    if not hits:
+    # Ask for enough rows to cover the requested page plus some slack for
+    # rows the READY filter may drop; widen and retry if it still falls short.
+    want = max(int(limit), 1) + max(int(offset), 0)
+    k = want + _READY_SLACK
+    hits: List[Hit] = []
+    for _ in range(1 + _READY_RETRIES):
+        try:
+            raw: List[Hit] = pgtrgm_backend.search(q=q, filters=filters, k=k, db=db)
+        except Exception:
+            # Defensive: never let backend errors bubble up to the route
+            raw = []
+
+        hits = _filter_ready_hits(db, raw) if post_filter else raw
+        # Stop once the page is covered or the backend has nothing more to give.
+        if len(hits) >= want or len(raw) < k:
+            break
+        k *= 2
+
+    hits = list(islice(hits, offset, offset + limit))
+
+    # If nothing matched via normal lexical fields, try a single UID/slug fallback
+    # (a UID-shaped query already had its exact probe above).
+    if not hits and not uid_probed:
         return _fallback_uid_or_slug_hit(db, q, types, include_pending)
 
     return hits
@@ -160,13 +197,13 @@ def run_keyword(
     - LIKE fallback when SEARCH_LEXICAL_BACKEND=none (SQLite/dev)
     Returns a list[Hit] compatible with ranker.merge_and_score.
     """
-    backend = getattr(settings, "SEARCH_LEXICAL_BACKEND", "none").lower()
-
-    if backend == "pgtrgm":
+    if _LEXICAL_BACKEND == "pgtrgm":
         return run_pgtrgm(db, q, types, include_pending, limit, offset)
 
-    # Dev fallback — LIKE over name/summary/description; returns Entity rows
-    entities: List[Entity] = search_like(
+    # Dev fallback — LIKE over name/summary/description, with the per-row
+    # (term, field) match count computed and ranked in SQL so the text
+    # columns stay server-side.
+    rows = search_like_scored(
         db=db,
         q=q,
         types=types,
@@ -176,27 +213,16 @@ def run_keyword(
     )
 
     # Compute a crude lexical score based on matches across fields.
-    q_l = (q or "").strip().lower()
     sims_raw: List[float] = []
     meta: List[Dict] = []
 
-    for e in entities:
-        name = (e.name or "").lower()
-        summary = (e.summary or "").lower()
-        description = (e.description or "").lower()
-        hits = 0
-        if q_l and q_l in name:
-            hits += 1
-        if q_l and q_l in summary:
-            hits += 1
-        if q_l and q_l in description:
-            hits += 1
-        sims_raw.append(hits / 3.0 if q_l else 0.0)
+    for uid, release_ts, created_at, quality_score, hits in rows:
+        sims_raw.append(float(hits))
         meta.append(
             {
-                "uid": e.uid,
-                "ts": (e.release_ts or e.created_at),
-                "quality": float(e.quality_score or 0.0),
+                "uid": uid,
+                "ts": (release_ts or created_at),
+                "quality": float(quality_score or 0.0),
             }
         )
 
@@ -7,10 +7,12 @@ implementations live under `backends/` (e.g., pgtrgm, pgvector).
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Protocol, TypedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Protocol
 
 
-class Hit(TypedDict, total=False):
+@dataclass(slots=True)
+class Hit:
     """
     Generic hit structure produced by backends.
 
@@ -23,13 +25,16 @@ class Hit(TypedDict, total=False):
       - quality: float      # quality signal (0..1)
       - recency: float      # recency signal (0..1)
       - best_chunk_id: str  # for vector hits (best matching chunk)
+
+    A slotted dataclass rather than a dict: backends return hundreds of these
+    per query, and attribute access skips the per-key hash lookup.
     """
     entity_id: str
     score: float
-    source: str
-    quality: float
-    recency: float
-    best_chunk_id: str
+    source: str = ""
+    quality: float = 0.0
+    recency: float = 0.0
+    best_chunk_id: str = ""
 
 
 class LexicalBackend(Protocol):
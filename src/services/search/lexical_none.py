@@ -1,9 +1,10 @@
 # src/services/search/lexical_none.py
 from __future__ import annotations
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session, load_only
-from sqlalchemy import or_, func
+from sqlalchemy import case, literal, or_
 
 from src.models import Entity
 
@@ -16,6 +17,49 @@ def _escape_like(s: str) -> str:
     return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+@lru_cache(maxsize=256)
+def _like_patterns(q: Optional[str]) -> Tuple[str, ...]:
+    """
+    One escaped '%term%' pattern per whitespace-separated query term.
+
+    Multi-word queries match a field when any term occurs in it, instead of
+    requiring the whole phrase verbatim. Empty tuple when q is blank.
+    """
+    terms = dict.fromkeys((q or "").lower().split())  # de-dupe, keep order
+    return tuple(f"%{_escape_like(t)}%" for t in terms)
+
+
+def _field_matches(patterns: Tuple[str, ...]):
+    """Per-field case-insensitive LIKE predicates (name, summary, description).
+
+    Always ILIKE on the raw columns: on Postgres this lets the planner use the
+    `ix_entity_*_trgm` GIN indexes (migration 9c4a1f7b3d2e), which are built on
+    the bare columns, not lower(col). SQLAlchemy renders it as
+    lower(col) LIKE lower(:q) on SQLite, so the match set is unchanged there.
+    """
+    return tuple(
+        or_(*(col.ilike(p, escape="\\") for p in patterns))
+        for col in (Entity.name, Entity.summary, Entity.description)
+    )
+
+
+def _apply_filters(base, patterns: Tuple[str, ...], types: Optional[List[str]], include_pending: bool):
+    """Shared type / READY / text filters for both LIKE queries."""
+    if types:
+        base = base.filter(Entity.type.in_(types))
+
+    if not include_pending:
+        base = base.filter(
+            Entity.gateway_registered_at.isnot(None),
+            Entity.gateway_error.is_(None),
+        )
+
+    if patterns:
+        base = base.filter(or_(*_field_matches(patterns)))
+
+    return base
+
+
 def search_like(
     db: Session,
     q: str,
@@ -26,13 +70,13 @@ def search_like(
 ):
     """Naive LIKE-based keyword search for dev/SQLite.
 
-    - Matches case-insensitively across name, summary, description.
+    - Matches case-insensitively across name, summary, description
+      (any query term, see `_like_patterns`).
     - Optionally restricts to READY-only (default) unless include_pending=True.
     - Returns a list of Entity rows ordered by recency.
     - Optimized to load only necessary columns.
     """
-    q = (q or "").strip().lower()
-    qs = f"%{_escape_like(q)}%" if q else None
+    patterns = _like_patterns(q)
 
     base = (
         db.query(Entity)
@@ -49,27 +93,59 @@ def search_like(
             )
         )
     )
+    base = _apply_filters(base, patterns, types, include_pending)
 
-    if types:
-        base = base.filter(Entity.type.in_(types))
+    return (
+        base.order_by(Entity.created_at.desc())
+        .limit(int(limit))
+        .offset(int(offset))
+        .all()
+    )
 
-    if not include_pending:
-        base = base.filter(
-            Entity.gateway_registered_at.isnot(None),
-            Entity.gateway_error.is_(None),
-        )
 
-    if qs is not None:
-        base = base.filter(
-            or_(
-                func.lower(Entity.name).like(qs, escape="\\"),
-                func.lower(Entity.summary).like(qs, escape="\\"),
-                func.lower(Entity.description).like(qs, escape="\\"),
-            )
+def search_like_scored(
+    db: Session,
+    q: str,
+    types: Optional[List[str]] = None,
+    include_pending: bool = False,
+    limit: int = 50,
+    offset: int = 0,
+):
+    """Same match set as `search_like`, scored and ranked in SQL.
+
+    Returns rows of (uid, release_ts, created_at, quality_score, hits) where
+    `hits` counts the (query term, field) pairs that match across
+    name/summary/description, so entities containing more of the terms score
+    higher. Rows are ordered by hits (then recency) before limit/offset, so
+    pages follow the ranking. The text columns are only referenced in the
+    WHERE/SELECT expressions, so large descriptions never leave the database.
+    """
+    patterns = _like_patterns(q)
+
+    if patterns:
+        hits = sum(
+            (
+                case((col.ilike(p, escape="\\"), 1), else_=0)
+                for p in patterns
+                for col in (Entity.name, Entity.summary, Entity.description)
+            ),
+            literal(0),
         )
+    else:
+        hits = literal(0)
+    hits = hits.label("hits")
+
+    base = db.query(
+        Entity.uid,
+        Entity.release_ts,
+        Entity.created_at,
+        Entity.quality_score,
+        hits,
+    )
+    base = _apply_filters(base, patterns, types, include_pending)
 
     return (
-        base.order_by(Entity.created_at.desc())
+        base.order_by(hits.desc(), Entity.created_at.desc())
         .limit(int(limit))
         .offset(int(offset))
         .all()
@@ -9,52 +9,81 @@ score_final = w_sem*sem + w_lex*lex + w_q*qual + w_r*rec
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-from ...config import settings
+from ...config import on_settings_reload, settings
 from .interfaces import Hit
 
+# NumPy is optional; without it every merge takes the scalar path.
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
 
-def _to_map(hits: List[Hit]) -> Dict[str, Hit]:
-    out: Dict[str, Hit] = {}
+# (semantic, lexical, quality, recency), bound from settings.SEARCH_WEIGHTS
+_WEIGHTS: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+
+
+@on_settings_reload
+def _bind_settings() -> None:
+    global _WEIGHTS
+    w = settings.SEARCH_WEIGHTS
+    _WEIGHTS = (w.semantic, w.lexical, w.quality, w.recency)
+
+
+# Below this many candidates the per-call NumPy overhead outweighs the gain.
+_VECTORIZE_MIN = 64
+
+
+def _to_map(
+    hits: List[Hit], source: str
+) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, float]]:
+    """
+    Collapse hits from one source into flat per-entity scalar maps.
+
+    Duplicates keep the best score; quality/recency come from the first hit
+    seen for an entity.
+    """
+    score: Dict[str, float] = {}
+    qual: Dict[str, float] = {}
+    rec: Dict[str, float] = {}
     for h in hits:
-        eid = h["entity_id"]
-        if eid not in out:
-            out[eid] = dict(h)  # copy
-        else:
-            # Keep the better score for duplicates from the same source
-            if h.get("source") == "lexical":
-                out[eid]["score"] = max(float(out[eid].get("score", 0.0)), float(h["score"]))
-            elif h.get("source") == "vector":
-                out[eid]["score"] = max(float(out[eid].get("score", 0.0)), float(h["score"]))
-    return out
+        if h.source != source:
+            continue
+        eid = h.entity_id
+        s = float(h.score)
+        prev = score.get(eid)
+        if prev is None:
+            score[eid] = s
+            qual[eid] = float(h.quality)
+            rec[eid] = float(h.recency)
+        elif s > prev:
+            score[eid] = s
+    return score, qual, rec
 
 
 def merge_and_score(lex_hits: List[Hit], vec_hits: List[Hit]) -> List[Dict]:
-    w = settings.SEARCH_WEIGHTS
+    w_sem, w_lex, w_q, w_r = _WEIGHTS
 
-    lex_map = _to_map([h for h in lex_hits if h.get("source") == "lexical"])
-    vec_map = _to_map([h for h in vec_hits if h.get("source") == "vector"])
+    lex_score, lex_qual, lex_rec = _to_map(lex_hits, "lexical")
+    vec_score, vec_qual, vec_rec = _to_map(vec_hits, "vector")
 
-    entity_ids = set(lex_map.keys()) | set(vec_map.keys())
+    entity_ids = lex_score.keys() | vec_score.keys()
 
-    merged: List[Dict] = []
-    for eid in entity_ids:
-        lex = float(lex_map.get(eid, {}).get("score", 0.0))
-        sem = float(vec_map.get(eid, {}).get("score", 0.0))
-        qual = float(
-            (lex_map.get(eid, {}).get("quality", 0.0) + vec_map.get(eid, {}).get("quality", 0.0)) / 2.0
-        )
-        rec = float(
-            (lex_map.get(eid, {}).get("recency", 0.0) + vec_map.get(eid, {}).get("recency", 0.0)) / 2.0
+    if np is not None and len(entity_ids) >= _VECTORIZE_MIN:
+        return _merge_vectorized(
+            list(entity_ids),
+            (lex_score, lex_qual, lex_rec),
+            (vec_score, vec_qual, vec_rec),
+            _WEIGHTS,
         )
 
-        score_final = (
-            w.semantic * sem +
-            w.lexical * lex +
-            w.quality * qual +
-            w.recency * rec
-        )
+    merged: List[Dict] = []
+    for eid in entity_ids:
+        lex = lex_score.get(eid, 0.0)
+        sem = vec_score.get(eid, 0.0)
+        qual = 0.5 * (lex_qual.get(eid, 0.0) + vec_qual.get(eid, 0.0))
+        rec = 0.5 * (lex_rec.get(eid, 0.0) + vec_rec.get(eid, 0.0))
 
         merged.append(
             {
@@ -63,9 +92,49 @@ def merge_and_score(lex_hits: List[Hit], vec_hits: List[Hit]) -> List[Dict]:
                 "score_semantic": sem,
                 "score_quality": qual,
                 "score_recency": rec,
-                "score_final": score_final,
+                "score_final": w_sem * sem + w_lex * lex + w_q * qual + w_r * rec,
             }
         )
 
     merged.sort(key=lambda x: x["score_final"], reverse=True)
     return merged
+
+
+def _merge_vectorized(
+    ids: List[str],
+    lex_maps: Tuple[Dict[str, float], Dict[str, float], Dict[str, float]],
+    vec_maps: Tuple[Dict[str, float], Dict[str, float], Dict[str, float]],
+    weights: Tuple[float, float, float, float],
+) -> List[Dict]:
+    """
+    NumPy variant of the scoring loop for large candidate pools.
+
+    Uses float64 so scores match the scalar path exactly, and a stable
+    argsort so ties keep the same order as ``list.sort``.
+    """
+    lex_score, lex_qual, lex_rec = lex_maps
+    vec_score, vec_qual, vec_rec = vec_maps
+    w_sem, w_lex, w_q, w_r = weights
+    n = len(ids)
+
+    def _col(m: Dict[str, float]):
+        return np.fromiter((m.get(eid, 0.0) for eid in ids), dtype=np.float64, count=n)
+
+    lex = _col(lex_score)
+    sem = _col(vec_score)
+    qual = 0.5 * (_col(lex_qual) + _col(vec_qual))
+    rec = 0.5 * (_col(lex_rec) + _col(vec_rec))
+    final = w_sem * sem + w_lex * lex + w_q * qual + w_r * rec
+
+    order = np.argsort(-final, kind="stable")
+    return [
+        {
+            "entity_id": ids[i],
+            "score_lexical": float(lex[i]),
+            "score_semantic": float(sem[i]),
+            "score_quality": float(qual[i]),
+            "score_recency": float(rec[i]),
+            "score_final": float(final[i]),
+        }
+        for i in order.tolist()
+    ]
@@ -12,12 +12,23 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from sqlalchemy.orm import Session
 
 from ...models import Entity
-from ...config import settings  # NEW: for PUBLIC_BASE_URL when composing links
+from .interfaces import Hit
+from ...config import on_settings_reload, settings  # NEW: for PUBLIC_BASE_URL when composing links
+
+_PUBLIC_BASE_URL = ""
+
+
+@on_settings_reload
+def _bind_settings() -> None:
+    global _PUBLIC_BASE_URL
+    _PUBLIC_BASE_URL = (settings.PUBLIC_BASE_URL or "").rstrip("/")
 
 
 # -------- Filters --------
@@ -91,6 +102,23 @@ def compute_recency_score(ts: Optional[datetime], now: Optional[datetime] = None
 
 # -------- Serialization --------
 
+@lru_cache(maxsize=4096)
+def _ensure_list_str(s: str) -> Tuple[str, ...]:
+    """Parse a JSON or CSV string list once; repeated values hit the cache."""
+    s = s.strip()
+    if not s:
+        return ()
+    # Try to parse as a JSON list first
+    try:
+        parsed = json.loads(s)
+        if isinstance(parsed, list):
+            return tuple(str(x) for x in parsed)
+    except json.JSONDecodeError:
+        # If not JSON, fall back to splitting by comma
+        pass
+    return tuple(x.strip() for x in s.split(",") if x.strip())
+
+
 def _ensure_list(v: Any) -> list[str]:
     """
     Coerce common malformed inputs to a list of strings.
@@ -101,18 +129,7 @@ def _ensure_list(v: Any) -> list[str]:
     if isinstance(v, list):
         return [str(x) for x in v]
     if isinstance(v, str):
-        s = v.strip()
-        if not s:
-            return []
-        # Try to parse as a JSON list first
-        try:
-            parsed = json.loads(s)
-            if isinstance(parsed, list):
-                return [str(x) for x in parsed]
-        except json.JSONDecodeError:
-            # If not JSON, fall back to splitting by comma
-            pass
-        return [x.strip() for x in s.split(",") if x.strip()]
+        return list(_ensure_list_str(v))
     # Fallback for other iterable types like tuples or sets
     if isinstance(v, (tuple, set)):
         return [str(x) for x in v]
@@ -181,9 +198,9 @@ def serialize_hit(h: Dict[str, Any], db: Session, *, with_snippets: bool = False
         dto["manifest_url"] = e.source_url
     else:
         # Fallback to local resolver path; works if the manifest route is enabled.
-        dto["manifest_url"] = _join_url(settings.PUBLIC_BASE_URL, f"/catalog/manifest/{e.uid}")
+        dto["manifest_url"] = _join_url(_PUBLIC_BASE_URL, f"/catalog/manifest/{e.uid}")
 
-    dto["install_url"] = _join_url(settings.PUBLIC_BASE_URL, f"/catalog/install?id={e.uid}")
+    dto["install_url"] = _join_url(_PUBLIC_BASE_URL, f"/catalog/install?id={e.uid}")
 
     if with_snippets:
         text = (e.summary or e.description or "")[:200]
@@ -195,10 +212,9 @@ def serialize_hit(h: Dict[str, Any], db: Session, *, with_snippets: bool = False
 
 # -------- Totals --------
 
-def estimate_total(lex_hits: List[Dict[str, Any]], vec_hits: List[Dict[str, Any]]) -> int:
+def estimate_total(lex_hits: List[Hit], vec_hits: List[Hit]) -> int:
     """
     Rough total count estimate (distinct entity ids across both hit lists).
     This is a conservative figure because each backend already returned top-K.
     """
-    ids = {h.get("entity_id") for h in lex_hits} | {h.get("entity_id") for h in vec_hits}
-    return len([i for i in ids if i])
+    return len({h.entity_id for h in chain(lex_hits, vec_hits) if h.entity_id})
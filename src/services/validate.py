@@ -4,12 +4,14 @@ Manifest validation utilities.
 Responsibilities
 - Load JSON Schemas from the repo's ./schemas directory (configurable via env).
 - Validate a manifest dict against the appropriate schema based on `type`.
-- Apply schema defaults (where defined) into the manifest (non-destructive).
+- Apply schema defaults (where defined) into a copy of the manifest; the
+  caller's object, including nested objects that receive defaults, is left as is.
 - Return structured warnings for optional trust checks (signature/SBOM stubs).
 
 Usage
 - validate_manifest(manifest) -> dict
-    Raises ValueError on schema violations. Returns possibly-normalized manifest.
+    Raises ValueError on schema violations. Returns the default-enriched copy,
+    or the caller's own object when no default would be filled in.
 - validate_manifest_with_report(manifest) -> ValidationReport
     Includes warnings & schema id used; does not swallow errors, but exposes them.
 
@@ -21,14 +23,23 @@ Notes
 
 from __future__ import annotations
 
+import copy
 import json
+import logging
 import os
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Tuple
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft202012Validator, ValidationError as JSONSchemaValidationError
-from jsonschema.validators import extend
+import fastjsonschema
+from fastjsonschema import JsonSchemaValueException
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 # --------------------------------------------------------------------------------------
@@ -75,79 +86,175 @@ def _default_schemas_dir() -> Path:
 
 SCHEMAS_DIR = Path(os.getenv("VAL_SCHEMAS_DIR", _default_schemas_dir()))
 _SCHEMA_CACHE: Dict[str, Dict[str, Any]] = {}
-_STORE_BY_ID: Dict[str, Dict[str, Any]] = {}  # for $id-based resolution
+# Where a schema's defaults live: property name -> (has a "default",
+# defaults tree of its own "properties"). None means some default sits where
+# the tree can't follow (items, $defs, combinators), so always deep-copy.
+_DefaultsTree = Optional[Dict[str, Tuple[bool, Any]]]
+# mtype -> (schema, compiled validator, file mtime, defaults tree); swapped
+# as one tuple so readers see one snapshot.
+_LOADED: Dict[str, Tuple[Dict[str, Any], Callable[[Dict[str, Any]], Any], float, _DefaultsTree]] = {}
+_LOAD_LOCK = threading.Lock()  # guards publishing / the _refreshing set
+_FIRST_LOAD_LOCK = threading.Lock()
+
+# Schema files are re-stat'ed at most this often; an edited file is
+# recompiled in the background while the previous validator keeps serving.
+_MTIME_CHECK_INTERVAL_S = 2.0
+_next_mtime_check: Dict[str, float] = {}
+_refreshing: set = set()
+
+log = logging.getLogger(__name__)
 
 
 def _load_schema(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         data = json.load(f)
     return data
 
 
-def load_schemas() -> Dict[str, Dict[str, Any]]:
-    """
-    Load and cache JSON Schemas. Callable at startup or lazily on first use.
-    Returns a dict keyed by manifest type ('agent'|'tool'|'mcp_server').
-    """
-    global _SCHEMA_CACHE, _STORE_BY_ID
-
-    if _SCHEMA_CACHE:
-        return _SCHEMA_CACHE
-
+def _schema_path(mtype: str) -> Path:
     if not SCHEMAS_DIR.exists():
         raise FileNotFoundError(f"Schemas directory not found: {SCHEMAS_DIR}")
-
-    for mtype, filename in SCHEMA_FILES.items():
-        schema_path = SCHEMAS_DIR / filename
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-        schema = _load_schema(schema_path)
+    schema_path = SCHEMAS_DIR / SCHEMA_FILES[mtype]
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    return schema_path
+
+
+def _count_defaults(node: Any) -> int:
+    if isinstance(node, dict):
+        return ("default" in node) + sum(_count_defaults(v) for v in node.values())
+    if isinstance(node, list):
+        return sum(_count_defaults(v) for v in node)
+    return 0
+
+
+def _defaults_tree(schema: Dict[str, Any]) -> Tuple[Dict[str, Tuple[bool, Any]], int]:
+    """Map nested "properties" that carry defaults; also return how many were seen."""
+    tree: Dict[str, Tuple[bool, Any]] = {}
+    seen = 0
+    for key, prop in (schema.get("properties") or {}).items():
+        if not isinstance(prop, dict):
+            continue
+        children, n = _defaults_tree(prop)
+        has_default = "default" in prop
+        seen += n + has_default
+        if has_default or children:
+            tree[key] = (has_default, children)
+    return tree, seen
+
+
+def _compile_type(
+    mtype: str,
+) -> Tuple[Dict[str, Any], Callable[[Dict[str, Any]], Any], float, _DefaultsTree]:
+    """Parse + compile one schema file and publish it. Caller holds no lock."""
+    schema_path = _schema_path(mtype)
+    mtime = schema_path.stat().st_mtime
+    schema = _load_schema(schema_path)
+    # Generate one validate-plus-defaults function per manifest type.
+    # use_formats=False: "format" stays an annotation, not an assertion,
+    # so manifests with e.g. relative URLs keep validating.
+    validator = fastjsonschema.compile(schema, use_default=True, use_formats=False)
+    tree, seen = _defaults_tree(schema)
+    defaults: _DefaultsTree = tree if seen == _count_defaults(schema) else None
+    entry = (schema, validator, mtime, defaults)
+    with _LOAD_LOCK:
+        _LOADED[mtype] = entry
         _SCHEMA_CACHE[mtype] = schema
-        schema_id = schema.get("$id")
-        if schema_id:
-            _STORE_BY_ID[schema_id] = schema
-
-    return _SCHEMA_CACHE
-
+    return entry
+
+
+def _refresh_in_background(mtype: str) -> None:
+    def run() -> None:
+        try:
+            _compile_type(mtype)
+            log.info("Reloaded %s manifest schema", mtype)
+        except Exception as e:
+            # Keep serving the previous validator; retry on a later check.
+            log.warning("Schema reload for %s failed; keeping cached copy: %s", mtype, e)
+        finally:
+            with _LOAD_LOCK:
+                _refreshing.discard(mtype)
+
+    with _LOAD_LOCK:
+        if mtype in _refreshing:
+            return
+        _refreshing.add(mtype)
+    threading.Thread(target=run, name=f"schema-reload-{mtype}", daemon=True).start()
+
+
+def _maybe_refresh(mtype: str, cached_mtime: float) -> None:
+    now = time.monotonic()
+    if now < _next_mtime_check.get(mtype, 0.0):
+        return  # unlocked fast path; re-checked below
+    with _LOAD_LOCK:
+        # Only one caller per interval gets to stat the file.
+        if now < _next_mtime_check.get(mtype, 0.0):
+            return
+        _next_mtime_check[mtype] = now + _MTIME_CHECK_INTERVAL_S
+    try:
+        mtime = (SCHEMAS_DIR / SCHEMA_FILES[mtype]).stat().st_mtime
+    except OSError:
+        return  # file vanished: keep serving the cached schema
+    if mtime > cached_mtime:
+        _refresh_in_background(mtype)
 
-# --------------------------------------------------------------------------------------
-# JSON Schema validator with defaults application
-# --------------------------------------------------------------------------------------
 
-def _extend_with_default(validator_class):
+def _load_type(
+    mtype: str,
+) -> Tuple[Dict[str, Any], Callable[[Dict[str, Any]], Any], _DefaultsTree]:
     """
-    Extend a jsonschema validator to apply default values to the instance.
-    This mutates the instance dict *during* validation for keys with "default".
+    Return (schema, validator, defaults tree) for one manifest
+    type, all from the same compiled snapshot, loading it on first
+    use so a process that only sees agents never parses or compiles the
+    tool / mcp_server schemas. Later edits to the file are picked up
+    stale-while-revalidate: the cached validator is returned immediately
+    and a recompile runs on a daemon thread.
     """
-    validate_properties = validator_class.VALIDATORS.get("properties")
+    entry = _LOADED.get(mtype)
+    if entry is not None:
+        _maybe_refresh(mtype, entry[2])
+        return entry[0], entry[1], entry[3]
 
-    def set_defaults(validator, properties, instance, schema):
-        if isinstance(instance, dict):
-            for prop, subschema in (properties or {}).items():
-                if "default" in subschema and prop not in instance:
-                    instance[prop] = subschema["default"]
-        if validate_properties is not None:
-            # Continue normal validation
-            for error in validate_properties(validator, properties, instance, schema):
-                yield error
+    # Serialize first loads so concurrent first callers don't all compile.
+    with _FIRST_LOAD_LOCK:
+        entry = _LOADED.get(mtype) or _compile_type(mtype)
+    with _LOAD_LOCK:
+        _next_mtime_check[mtype] = time.monotonic() + _MTIME_CHECK_INTERVAL_S
+    return entry[0], entry[1], entry[3]
 
-    return extend(validator_class, {"properties": set_defaults})
 
+def load_schemas() -> Dict[str, Dict[str, Any]]:
+    """
+    Load and cache all JSON Schemas (e.g. to warm up at startup).
+    Validation itself loads each type lazily on first use.
+    Returns a dict keyed by manifest type ('agent'|'tool'|'mcp_server').
+    """
+    for mtype in SCHEMA_FILES:
+        _load_type(mtype)
+    return _SCHEMA_CACHE
 
-DefaultingValidator = _extend_with_default(Draft202012Validator)
 
+# --------------------------------------------------------------------------------------
+# Compiled validators (defaults applied by the generated code)
+# --------------------------------------------------------------------------------------
 
-def _validator_for(manifest_type: str) -> Tuple[Draft202012Validator, Dict[str, Any]]:
-    schemas = load_schemas()
+def _validator_for(
+    manifest_type: str,
+) -> Tuple[Callable[[Dict[str, Any]], Any], Dict[str, Any], _DefaultsTree]:
+    """
+    Return (validate_fn, schema, defaults) for a manifest type, taken from
+    one snapshot. validate_fn applies defaults into the instance in place
+    and raises JsonSchemaValueException on the first violation; defaults
+    says where it may write (see _DefaultsTree). Schemas only use local
+    "#/$defs/..." refs.
+    """
     key = manifest_type.strip().lower()
-    if key not in schemas:
+    if key not in SCHEMA_FILES:
         raise ValueError(f"Unknown manifest type '{manifest_type}' (expected one of {list(SCHEMA_FILES)})")
-    schema = schemas[key]
-    # The modern `jsonschema` prefers using a schema directly; $ref resolution will
-    # work for internal references. For cross-file $id resolution, we'd need a
-    # referencing registry; for now we assume local references only.
-    validator = DefaultingValidator(schema)
-    return validator, schema
+    schema, validate, defaults = _load_type(key)
+    return validate, schema, defaults
 
 
 # --------------------------------------------------------------------------------------
@@ -170,49 +277,49 @@ def validate_manifest(manifest: Dict[str, Any]) -> Dict[str, Any]:
 def validate_manifest_with_report(manifest: Dict[str, Any]) -> ValidationReport:
     """
     As above, but returns a structured report with warnings and schema id.
-    Never mutates the caller's object (works on a shallow copy).
+    Never mutates the caller's object: defaults are applied to a copy of
+    every dict on the way to a missing default. When no default would be
+    filled in, the caller's object is validated and returned as is.
     """
     if not isinstance(manifest, dict):
         raise ValueError("Manifest must be a mapping/dict.")
 
-    # Shallow copy to avoid mutating caller; defaults will be applied to this copy.
-    instance: Dict[str, Any] = dict(manifest)
-
-    mtype = str(instance.get("type") or "").strip()
+    mtype = str(manifest.get("type") or "").strip()
     if not mtype:
         return ValidationReport(
             is_valid=False,
-            manifest=instance,
+            manifest=dict(manifest),
             errors=[ValidationIssue(level="error", code="missing_type", message="Manifest is missing 'type'")],
         )
 
+    validate, schema, defaults = _validator_for(mtype)
+    if defaults is None:
+        instance: Dict[str, Any] = copy.deepcopy(manifest)
+    elif _would_fill(manifest, defaults):
+        instance = _copy_along(manifest, defaults)
+    else:
+        instance = manifest
+
     try:
-        validator, schema = _validator_for(mtype)
-        validator.validate(instance)  # applies defaults via DefaultingValidator
+        validate(instance)  # applies schema defaults into `instance`
         is_valid = True
         errors: List[ValidationIssue] = []
-    except JSONSchemaValidationError as exc:
+    except JsonSchemaValueException as exc:
         is_valid = False
+        loc = _error_path(exc)
         errors = [
             ValidationIssue(
                 level="error",
                 code="schema_violation",
                 message=_format_jsonschema_error(exc),
-                field=".".join(str(p) for p in exc.path) or None,
+                field=loc,
             )
         ]
 
-    # Optional trust checks (stub implementations):
-    warnings: List[ValidationIssue] = []
-    try:
-        warnings.extend(check_signature(instance))
-    except Exception as e:
-        warnings.append(ValidationIssue(level="warning", code="signature_check_error", message=str(e)))
-
-    try:
-        warnings.extend(check_sbom(instance))
-    except Exception as e:
-        warnings.append(ValidationIssue(level="warning", code="sbom_check_error", message=str(e)))
+    # Optional trust checks (stub implementations): signature warnings first,
+    # then SBOM warnings, as the separate checks used to report them.
+    sig_warnings, sbom_warnings = _trust_scan(instance)
+    warnings = sig_warnings + sbom_warnings
 
     return ValidationReport(
         is_valid=is_valid,
@@ -227,105 +334,129 @@ def validate_manifest_with_report(manifest: Dict[str, Any]) -> ValidationReport:
 # Trust checks (stubs) — replace with real implementations later
 # --------------------------------------------------------------------------------------
 
-def check_signature(manifest: Dict[str, Any]) -> List[ValidationIssue]:
-    """
-    Stub hook: inspect signature hints and return warnings.
-
-    Heuristics:
-    - If 'sig_uri' is present at the root or in artifacts but signature verification
-      is not configured, emit a warning that verification is skipped.
-    - If OCI/PyPI artifacts have a digest/hash field missing, warn.
-    """
-    warnings: List[ValidationIssue] = []
-
-    # Root-level signature hint
-    if "sig_uri" in manifest:
-        warnings.append(
+def _signature_hints(node: Dict[str, Any], field_base: Optional[str], out: List[ValidationIssue]) -> None:
+    if "sig_uri" in node:
+        out.append(
             ValidationIssue(
                 level="warning",
                 code="signature_not_verified",
-                message="sig_uri present but cryptographic verification is not enabled; skipping.",
-                field="sig_uri",
+                message=(
+                    f"{field_base}.sig_uri present but not verified; skipping."
+                    if field_base
+                    else "sig_uri present but cryptographic verification is not enabled; skipping."
+                ),
+                field=f"{field_base}.sig_uri" if field_base else "sig_uri",
             )
         )
-
-    artifacts = manifest.get("artifacts") or []
-    if isinstance(artifacts, list):
-        for idx, art in enumerate(artifacts):
-            if not isinstance(art, dict):
-                continue
-            kind = str(art.get("kind") or "")
-            spec = art.get("spec") or {}
-            field_base = f"artifacts[{idx}]"
-
-            # Generic signature hint
-            if "sig_uri" in art:
-                warnings.append(
-                    ValidationIssue(
-                        level="warning",
-                        code="signature_not_verified",
-                        message=f"{field_base}.sig_uri present but not verified; skipping.",
-                        field=f"{field_base}.sig_uri",
-                    )
+    # Digest/hash presence check for immutable references
+    if field_base and node.get("kind") in ("oci", "zip"):
+        spec = node.get("spec")
+        digest = (spec.get("digest") if isinstance(spec, dict) else None) or node.get("digest") or node.get("hash")
+        if not digest:
+            out.append(
+                ValidationIssue(
+                    level="warning",
+                    code="missing_digest",
+                    message=f"{field_base} is missing an immutable digest/hash; installs may be non-reproducible.",
+                    field=f"{field_base}.spec",
                 )
+            )
 
-            # Digest/hash presence check for immutable references
-            if kind in ("oci", "pypi", "zip", "git"):
-                digest = spec.get("digest") or art.get("digest") or art.get("hash")
-                if not digest and kind in ("oci", "zip"):
-                    warnings.append(
-                        ValidationIssue(
-                            level="warning",
-                            code="missing_digest",
-                            message=f"{field_base} is missing an immutable digest/hash; installs may be non-reproducible.",
-                            field=f"{field_base}.spec",
-                        )
-                    )
-
-    return warnings
-
-
-def check_sbom(manifest: Dict[str, Any]) -> List[ValidationIssue]:
-    """
-    Stub hook: inspect SBOM hints and return warnings.
-
-    Heuristics:
-    - If 'sbom_uri' exists, warn that no SBOM scanning is configured.
-    """
-    warnings: List[ValidationIssue] = []
 
-    if "sbom_uri" in manifest:
-        warnings.append(
+def _sbom_hints(node: Dict[str, Any], field_base: Optional[str], out: List[ValidationIssue]) -> None:
+    if "sbom_uri" in node:
+        prefix = f"{field_base}." if field_base else ""
+        out.append(
             ValidationIssue(
                 level="warning",
                 code="sbom_not_scanned",
-                message="sbom_uri present but SBOM scanning is not configured; skipping.",
-                field="sbom_uri",
+                message=f"{prefix}sbom_uri present but SBOM scanning is not configured; skipping.",
+                field=f"{prefix}sbom_uri",
             )
         )
 
+
+def _trust_scan(manifest: Dict[str, Any]) -> Tuple[List[ValidationIssue], List[ValidationIssue]]:
+    """
+    Signature and SBOM heuristics in a single walk over `artifacts`.
+
+    Returns (signature warnings, SBOM warnings). A check that raises is
+    reported on its own as 'signature_check_error' / 'sbom_check_error'
+    and does not stop the other one.
+    """
+    sig: List[ValidationIssue] = []
+    sbom: List[ValidationIssue] = []
+    sig_err: Optional[Exception] = None
+    sbom_err: Optional[Exception] = None
+
     artifacts = manifest.get("artifacts") or []
+    nodes = [(manifest, None)]
     if isinstance(artifacts, list):
-        for idx, art in enumerate(artifacts):
-            if not isinstance(art, dict):
-                continue
-            field_base = f"artifacts[{idx}]"
-            if "sbom_uri" in art:
-                warnings.append(
-                    ValidationIssue(
-                        level="warning",
-                        code="sbom_not_scanned",
-                        message=f"{field_base}.sbom_uri present but SBOM scanning is not configured; skipping.",
-                        field=f"{field_base}.sbom_uri",
-                    )
-                )
-    return warnings
+        nodes += [(art, f"artifacts[{idx}]") for idx, art in enumerate(artifacts) if isinstance(art, dict)]
+
+    for node, field_base in nodes:
+        if sig_err is None:
+            try:
+                _signature_hints(node, field_base, sig)
+            except Exception as e:
+                sig_err = e
+        if sbom_err is None:
+            try:
+                _sbom_hints(node, field_base, sbom)
+            except Exception as e:
+                sbom_err = e
+
+    if sig_err is not None:
+        sig = [ValidationIssue(level="warning", code="signature_check_error", message=str(sig_err))]
+    if sbom_err is not None:
+        sbom = [ValidationIssue(level="warning", code="sbom_check_error", message=str(sbom_err))]
+    return sig, sbom
+
+
+def check_signature(manifest: Dict[str, Any]) -> List[ValidationIssue]:
+    """
+    Stub hook: signature-related warnings (sig_uri not verified, missing digest).
+    """
+    return _trust_scan(manifest)[0]
+
+
+def check_sbom(manifest: Dict[str, Any]) -> List[ValidationIssue]:
+    """
+    Stub hook: SBOM-related warnings (sbom_uri present but not scanned).
+    """
+    return _trust_scan(manifest)[1]
 
 
 # --------------------------------------------------------------------------------------
 # Helpers
 # --------------------------------------------------------------------------------------
 
-def _format_jsonschema_error(exc: JSONSchemaValidationError) -> str:
-    loc = ".".join(str(p) for p in exc.path) or "<root>"
-    return f"{loc}: {exc.message}"
+def _error_path(exc: JsonSchemaValueException) -> Optional[str]:
+    # exc.path starts with the root variable name ("data"); drop it so the
+    # location reads like the manifest's own dotted path.
+    path = exc.path or ()
+    return ".".join(map(str, path[1:])) or None
+
+
+def _would_fill(obj: Dict[str, Any], tree: Dict[str, Tuple[bool, Any]]) -> bool:
+    for key, (has_default, children) in tree.items():
+        if key not in obj:
+            if has_default:
+                return True
+        elif children and isinstance(obj[key], dict) and _would_fill(obj[key], children):
+            return True
+    return False
+
+
+def _copy_along(obj: Dict[str, Any], tree: Dict[str, Tuple[bool, Any]]) -> Dict[str, Any]:
+    # Copy only the dicts the validator may write into; the rest stay shared.
+    out = dict(obj)
+    for key, (_, children) in tree.items():
+        value = out.get(key)
+        if children and isinstance(value, dict):
+            out[key] = _copy_along(value, children)
+    return out
+
+
+def _format_jsonschema_error(exc: JsonSchemaValueException) -> str:
+    return f"{_error_path(exc) or '<root>'}: {exc.message}"
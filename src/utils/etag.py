@@ -11,36 +11,76 @@ from __future__ import annotations
 import hashlib
 import json
 from datetime import datetime, timezone
-from email.utils import format_datetime, parsedate_to_datetime
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 from starlette.requests import Request
 from starlette.responses import Response
 
+# Optional fast serializer; emits canonical, compact UTF-8 bytes directly.
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
-def _to_bytes(payload: Any) -> bytes:
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _to_bytes(
+    payload: Any,
+    _orjson_dumps=orjson.dumps if orjson is not None else None,
+    _json_dumps=json.dumps,
+) -> bytes:
     if payload is None:
         return b"null"
     if isinstance(payload, (bytes, bytearray, memoryview)):
         return bytes(payload)
     # Canonical JSON dump for stable hashing
-    return json.dumps(payload, separators=(",", ":"), sort_keys=True, ensure_ascii=False).encode("utf-8")
+    if _orjson_dumps is not None:
+        try:
+            return _orjson_dumps(payload, option=_ORJSON_OPTS)
+        except TypeError:
+            # Types orjson refuses (e.g. subclassed ints, huge ints); use stdlib.
+            pass
+    return _json_dumps(payload, separators=(",", ":"), sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+# ETags only need to detect change, not resist attack, so prefer the fastest
+# available 128-bit hash. All variants yield 32 hex chars, like MD5.
+try:
+    from blake3 import blake3 as _blake3
+
+    def _hexdigest(data: bytes) -> str:
+        return _blake3(data).hexdigest(length=16)
+except Exception:  # pragma: no cover
+    try:
+        import xxhash
+
+        def _hexdigest(data: bytes) -> str:
+            return xxhash.xxh3_128_hexdigest(data)
+    except Exception:
+        def _hexdigest(data: bytes) -> str:
+            return hashlib.md5(data).hexdigest()  # nosec - ETag, not security
+
+
+def _digest(payload: Any) -> str:
+    return _hexdigest(_to_bytes(payload))
 
 
 def weak_etag(payload: Any) -> str:
     """
     Compute a weak ETag of the given payload.
     """
-    digest = hashlib.md5(_to_bytes(payload)).hexdigest()  # nosec - ETag, not security
-    return f'W/"{digest}"'
+    return f'W/"{_digest(payload)}"'
 
 
 def strong_etag(payload: Any) -> str:
     """
     Compute a strong ETag (same hash, but without W/ prefix).
     """
-    digest = hashlib.md5(_to_bytes(payload)).hexdigest()  # nosec - ETag, not security
-    return f'"{digest}"'
+    return f'"{_digest(payload)}"'
 
 
 def check_not_modified(
@@ -92,23 +132,35 @@ def set_cache_headers(
     if etag:
         response.headers["ETag"] = etag
     if last_modified:
-        # RFC 7231 IMF-fixdate
         if last_modified.tzinfo is None:
             last_modified = last_modified.replace(tzinfo=timezone.utc)
-        response.headers["Last-Modified"] = format_datetime(last_modified)
+        response.headers["Last-Modified"] = _http_date(int(last_modified.timestamp()))
     if cache_control:
         response.headers["Cache-Control"] = cache_control
 
 
 # ---- helpers ----
 
+@lru_cache(maxsize=1024)
+def _http_date(ts: int) -> str:
+    """RFC 7231 IMF-fixdate for a Unix timestamp (locale-independent)."""
+    return formatdate(ts, usegmt=True)
+
+
 def _etag_matches(etag: str, if_none_match_value: str) -> bool:
     """
     Compare an ETag against an If-None-Match header value.
     Supports lists and wildcards.
     """
-    inm = [x.strip() for x in if_none_match_value.split(",") if x.strip()]
-    if "*" in inm:
+    v = if_none_match_value.strip()
+    if v == "*":
         return True
     # compare case-sensitively as per RFC semantics
-    return etag in inm
+    if "," not in v:
+        # Common case: a single validator echoed back by the client.
+        return etag == v
+    for x in v.split(","):
+        x = x.strip()
+        if x == "*" or x == etag:
+            return True
+    return False
@@ -1,8 +1,14 @@
 # src/utils/jwt_helper.py
 
+import base64
+import hashlib
+import hmac
+import json
 import os
 import time
 import logging
+from functools import cache
+from typing import NamedTuple, Optional
 
 # defer PyJWT import so matrix-hub can run without it if not needed
 try:
@@ -10,8 +16,87 @@ try:
 except ImportError:
     jwt = None
 
+try:  # optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 log = logging.getLogger(__name__)
 
+# Clock used for iat/exp and cache expiry; tests patch this, not time.time.
+_now = time.time
+
+# Minted JWTs, reused until shortly before they expire.
+# Key: (blake2b(secret), user, ttl_seconds) -> (token, exp). The secret itself
+# is never stored. Bounded: callers may pass arbitrary usernames / ttls.
+_TOKEN_CACHE: dict[tuple[str, str, int], tuple[str, int]] = {}
+_TOKEN_CACHE_MAX = 64
+_REFRESH_MARGIN_S = 30
+
+
+def _cache_token(key: tuple[str, str, int], token: str, exp: int, now: int) -> None:
+    """Store a minted token; when full, drop expired entries, then the oldest."""
+    if key not in _TOKEN_CACHE and len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+        for k in [k for k, (_, k_exp) in _TOKEN_CACHE.items() if k_exp <= now]:
+            del _TOKEN_CACHE[k]
+        if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+            del _TOKEN_CACHE[next(iter(_TOKEN_CACHE))]
+    _TOKEN_CACHE[key] = (token, exp)
+
+
+def _token_cache_key(secret: str, user: str, ttl_seconds: int) -> tuple[str, str, int]:
+    digest = hashlib.blake2b(secret.encode("utf-8"), digest_size=8).hexdigest()
+    return digest, user, ttl_seconds
+
+
+class _Env(NamedTuple):
+    jwt_secret: Optional[str]
+    user: Optional[str]
+    gateway_token: Optional[str]
+    basic_password: Optional[str]
+
+
+@cache
+def _env_snapshot() -> _Env:
+    """
+    Read the gateway-auth environment once per process. Tests that change
+    these variables call _env_snapshot.cache_clear().
+    """
+    return _Env(
+        jwt_secret=os.getenv("JWT_SECRET_KEY"),
+        user=os.getenv("BASIC_AUTH_USERNAME") or os.getenv("BASIC_AUTH_USER"),
+        gateway_token=os.getenv("MCP_GATEWAY_TOKEN") or os.getenv("ADMIN_TOKEN"),
+        basic_password=os.getenv("BASIC_AUTH_PASSWORD"),
+    )
+
+
+@cache
+def _basic_header(user: str, pwd: str) -> str:
+    """'Basic <base64(user:pwd)>'; credentials are process-constant."""
+    return "Basic " + base64.b64encode(f"{user}:{pwd}".encode("utf-8")).decode("ascii")
+
+
+def _b64url(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+# The header never changes for the HS256 tokens minted here.
+_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+
+def _encode_hs256(payload: dict, secret: str) -> str:
+    """
+    Encode an HS256 JWT directly (header.payload.signature, base64url without
+    padding). Equivalent to jwt.encode(payload, secret, algorithm="HS256").
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    signing_input = _HEADER_B64 + b"." + _b64url(body)
+    sig = hmac.new(secret.encode("utf-8"), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(sig)).decode("ascii")
+
 
 def get_mcp_admin_token(
     secret: str | None = None,
@@ -24,48 +109,51 @@ def get_mcp_admin_token(
     or fall back to MCP_GATEWAY_TOKEN / ADMIN_TOKEN or HTTP Basic if minting fails.
     """
     # 1) load inputs
-    secret = secret or os.getenv("JWT_SECRET_KEY")
-    user = (
-        username
-        or os.getenv("BASIC_AUTH_USERNAME")
-        or os.getenv("BASIC_AUTH_USER")
-        or "admin"
-    )
-    now = int(time.time())
+    env = _env_snapshot()
+    secret = secret or env.jwt_secret
+    user = username or env.user or "admin"
+    now = int(_now())
 
-    # 2) attempt mint via PyJWT
-    if jwt and secret:
+    # 2) attempt mint (direct HS256; PyJWT only as a fallback encoder)
+    if secret:
+        key = _token_cache_key(secret, user, ttl_seconds)
+        cached = _TOKEN_CACHE.get(key)
+        if cached and now < cached[1] - _REFRESH_MARGIN_S:
+            return cached[0]
+        exp = now + ttl_seconds
+        payload = {"sub": user, "iat": now, "exp": exp}
+        token = None
         try:
-            payload = {"sub": user, "iat": now, "exp": now + ttl_seconds}
-            token = jwt.encode(payload, secret, algorithm="HS256")
+            token = _encode_hs256(payload, secret)
+        except Exception as e:
+            if jwt:
+                try:
+                    token = jwt.encode(payload, secret, algorithm="HS256")
+                except Exception as e2:
+                    e = e2
+            if token is None:
+                log.warning("JWT minting failed (%s); falling back: %s", type(e).__name__, e)
+        if token is not None:
+            _cache_token(key, token, exp, now)
             log.debug("Minted temporary JWT (expiring in %ds)", ttl_seconds)
             return token
-        except Exception as e:
-            log.warning("JWT minting failed (%s); falling back: %s", type(e).__name__, e)
     else:
-        if not jwt:
-            log.warning("PyJWT not installed; cannot mint JWT")
-        if not secret:
-            log.warning("JWT_SECRET_KEY missing; cannot mint JWT")
+        log.warning("JWT_SECRET_KEY missing; cannot mint JWT")
 
     # 3) fallback to explicit tokens in env (prefer MCP_GATEWAY_TOKEN, then ADMIN_TOKEN)
-    fb = fallback_token or os.getenv("MCP_GATEWAY_TOKEN") or os.getenv("ADMIN_TOKEN")
+    fb = fallback_token or env.gateway_token
     if fb:
         log.debug("Using fallback gateway token from env")
         # Could already be prefixed; client will handle both raw and prefixed values
         return fb
 
     # 4) fallback to HTTP Basic if credentials present
-    pwd = os.getenv("BASIC_AUTH_PASSWORD")
+    pwd = env.basic_password
     if user and pwd:
-        import base64
-
-        creds = f"{user}:{pwd}".encode("utf-8")
-        token = base64.b64encode(creds).decode("utf-8")
         log.debug("Using HTTP Basic auth as fallback")
-        return f"Basic {token}"
+        return _basic_header(user, pwd)
 
     # 5) nothing left
     raise RuntimeError(
-        "Unable to obtain admin token: no PyJWT, JWT_SECRET_KEY, MCP_GATEWAY_TOKEN/ADMIN_TOKEN or BASIC_AUTH_PASSWORD"
+        "Unable to obtain admin token: no JWT_SECRET_KEY, MCP_GATEWAY_TOKEN/ADMIN_TOKEN or BASIC_AUTH_PASSWORD"
     )
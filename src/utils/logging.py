@@ -13,11 +13,31 @@ import logging
 import sys
 import time
 from contextvars import ContextVar
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:  # optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 # Public context var for correlation ID
 request_id_ctx: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
+# Last formatted timestamp as (epoch_second, "YYYY-MM-DDTHH:MM:SS"); records
+# logged within the same second share one strftime call. Swapped as a whole
+# tuple so concurrent handlers never see a mismatched pair.
+_TS_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _format_ts(created: float) -> str:
+    global _TS_CACHE
+    sec = int(created)
+    cached = _TS_CACHE
+    if cached[0] != sec:
+        cached = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+        _TS_CACHE = cached
+    return cached[1]
+
 
 class JsonFormatter(logging.Formatter):
     """
@@ -27,15 +47,25 @@ class JsonFormatter(logging.Formatter):
     the correlation ID when available (from context var).
     """
 
-    def format(self, record: logging.LogRecord) -> str:
+    # Hot path: helpers are bound as defaults so each lookup is a local,
+    # not a module-global, load. Callers never pass them.
+    def format(
+        self,
+        record: logging.LogRecord,
+        _format_ts=_format_ts,
+        _ctx_get=request_id_ctx.get,
+        _orjson_dumps=orjson.dumps if orjson is not None else None,
+        _json_dumps=json.dumps,
+        _DEBUG=logging.DEBUG,
+    ) -> str:
         payload: Dict[str, Any] = {
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
+            "ts": _format_ts(record.created),
             "level": record.levelname,
             "logger": record.name,
             "msg": record.getMessage(),
         }
 
-        rid = request_id_ctx.get()
+        rid = _ctx_get()
         if rid:
             payload["request_id"] = rid
 
@@ -44,12 +74,17 @@ class JsonFormatter(logging.Formatter):
             payload["exc_info"] = self.formatException(record.exc_info)
 
         # Attach module/file/line for debug levels
-        if record.levelno <= logging.DEBUG:
+        if record.levelno <= _DEBUG:
             payload["module"] = record.module
             payload["filename"] = record.filename
             payload["lineno"] = record.lineno
 
-        return json.dumps(payload, ensure_ascii=False)
+        if _orjson_dumps is not None:
+            try:
+                return _orjson_dumps(payload).decode("utf-8")
+            except TypeError:
+                pass
+        return _json_dumps(payload, ensure_ascii=False)
 
 
 def configure_json_logging(level: str | int = "INFO") -> None:
@@ -17,14 +17,25 @@ Usage in routes:
 
 from __future__ import annotations
 
+import hmac
+from typing import Optional
 
 from fastapi import HTTPException, Request, status
 
-from ..config import settings
+from ..config import on_settings_reload, settings
+
+# Configured token as bytes (None when auth is disabled); rebound on settings reload.
+_API_TOKEN_BYTES: Optional[bytes] = None
+
+
+@on_settings_reload
+def _bind_settings() -> None:
+    global _API_TOKEN_BYTES
+    _API_TOKEN_BYTES = settings.API_TOKEN.encode("utf-8") if settings.API_TOKEN else None
 
 
 def is_auth_enabled() -> bool:
-    return bool(settings.API_TOKEN)
+    return _API_TOKEN_BYTES is not None
 
 
 def require_api_token(request: Request) -> None:
@@ -47,7 +58,7 @@ def require_api_token(request: Request) -> None:
     elif "token" in request.query_params:
         token = request.query_params.get("token")
 
-    if not token or token != settings.API_TOKEN:
+    if not token or not hmac.compare_digest(token.encode("utf-8"), _API_TOKEN_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing bearer token.",
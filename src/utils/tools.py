@@ -20,9 +20,11 @@ The inline install reuses helpers from install.py to ensure consistent behavior:
 from __future__ import annotations
 
 import logging
-from dataclasses import asdict
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -33,6 +35,7 @@ from ..services.install import (  # type: ignore
     StepResult,
     _build_install_plan,
     _install_pypi,
+    _install_pypi_batch,
     _install_oci,
     _install_git,
     _install_zip,
@@ -40,6 +43,9 @@ from ..services.install import (  # type: ignore
     _build_lockfile,
     _write_lockfile,
     _relpath_or_abs,
+    _safe_folder_name,
+    _safe_join,
+    _step_to_dict,
 )
 
 # Entity model (local)
@@ -55,6 +61,183 @@ except Exception:  # pragma: no cover
 log = logging.getLogger("install.utils")
 
 
+@lru_cache(maxsize=128)
+def _resolved_path(target: str, cwd: str) -> Path:
+    # cwd is part of the key so relative targets never resolve against a stale cwd.
+    return Path(target).expanduser().resolve()
+
+
+def _resolve_target(target: str) -> Path:
+    """
+    Resolved target directory, created if missing. The symlink walk is
+    cached per (target, cwd), but only for directories that already existed:
+    a target created here is resolved afresh on the next call, so a symlink
+    put in its place in between is followed.
+    """
+    path = Path(target).expanduser()
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+        return path.resolve()
+    return _resolved_path(target, os.getcwd())
+
+
+# Upper bound on artifact steps (network / subprocess bound) run at once.
+_ARTIFACT_MAX_WORKERS = 8
+
+
+def _install_artifact(uid: str, idx: int, art: Dict[str, Any], tdir: Path) -> StepResult:
+    """Run one artifact step; errors become a failed StepResult, never raise."""
+    kind = (art.get("kind") or "").strip().lower()
+    spec = art.get("spec") or {}
+    step_name = f"artifact[{idx}]:{kind}"
+
+    try:
+        if kind == "pypi":
+            res = _install_pypi(spec)
+        elif kind == "oci":
+            res = _install_oci(spec)
+        elif kind == "git":
+            res = _install_git(spec, tdir)
+        elif kind == "zip":
+            res = _install_zip(spec, tdir)
+        else:
+            res = StepResult(step=step_name, ok=False, stderr=f"Unsupported artifact kind: {kind}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("artifact.done", extra={"uid": uid, "step": step_name, "ok": res.ok})
+        return res
+    except Exception as e:
+        log.exception("Failed step %s", step_name)
+        return StepResult(step=step_name, ok=False, stderr=str(e))
+
+
+def _artifact_dest(art: Dict[str, Any], tdir: Path) -> Optional[Path]:
+    """
+    Directory a git/zip step will write to, mirroring _install_git
+    (vendor/<dest|directory|repo stem>) and _install_zip (<dest|vendor_zip>).
+    None for kinds that write nowhere under tdir (pypi, oci) and for
+    malformed entries, which then fail in _install_artifact on their own.
+    """
+    if not isinstance(art, dict):
+        return None
+    kind = art.get("kind")
+    kind = kind.strip().lower() if isinstance(kind, str) else ""
+    spec = art.get("spec") or {}
+    if kind not in ("git", "zip") or not isinstance(spec, dict):
+        return None
+    try:
+        if kind == "git":
+            repo = (spec.get("repo") or "").strip()
+            folder = (spec.get("dest") or spec.get("directory") or "").strip()
+            if not repo:
+                return None
+            folder = folder or _safe_folder_name(Path(repo).stem or "repo")
+            return _safe_join(tdir / "vendor", folder)
+        return _safe_join(tdir, (spec.get("dest") or "vendor_zip").strip())
+    except (AttributeError, TypeError, ValueError, InstallError):
+        return None
+
+
+def _paths_overlap(a: Path, b: Path) -> bool:
+    """True when one path is the other or contains it."""
+    return a == b or a in b.parents or b in a.parents
+
+
+def _artifact_lanes(
+    artifacts: Sequence[dict], tdir: Path
+) -> List[Tuple[Hashable, List[Tuple[int, Dict[str, Any]]]]]:
+    """
+    Group artifacts into lanes of steps that must not overlap. pip/uv share
+    one site-packages and are not safe to run concurrently, so every pypi
+    step shares a lane; git and zip steps share one when their destinations
+    are the same directory or nested in each other. Everything else (oci,
+    unsupported or malformed entries) runs on its own.
+    """
+    pypi: List[Tuple[int, Dict[str, Any]]] = []
+    # [destinations, members] per destination lane; merged on overlap.
+    groups: List[Tuple[List[Path], List[Tuple[int, Dict[str, Any]]]]] = []
+    lanes: List[Tuple[Hashable, List[Tuple[int, Dict[str, Any]]]]] = []
+
+    for idx, art in enumerate(artifacts):
+        kind = art.get("kind") if isinstance(art, dict) else None
+        if isinstance(kind, str) and kind.strip().lower() == "pypi":
+            pypi.append((idx, art))
+            continue
+        dest = _artifact_dest(art, tdir)
+        if dest is None:
+            lanes.append((object(), [(idx, art)]))
+            continue
+        hits = [g for g in groups if any(_paths_overlap(dest, p) for p in g[0])]
+        merged: Tuple[List[Path], List[Tuple[int, Dict[str, Any]]]] = ([dest], [(idx, art)])
+        for g in hits:
+            groups.remove(g)
+            merged[0].extend(g[0])
+            merged[1].extend(g[1])
+        merged[1].sort(key=lambda pair: pair[0])  # manifest order within a lane
+        groups.append(merged)
+
+    if pypi:
+        lanes.append(("pypi", pypi))
+    lanes.extend((object(), members) for _, members in groups)
+    return lanes
+
+
+def _install_pypi_lane(
+    uid: str, lane: List[Tuple[int, Dict[str, Any]]], tdir: Path
+) -> List[Tuple[int, StepResult]]:
+    """
+    Install every pypi artifact with a single pip/uv call. The aggregated
+    result takes the first artifact's slot; specs missing a package still
+    fail individually.
+    """
+    out: List[Tuple[int, StepResult]] = []
+    batch: List[Tuple[int, Dict[str, Any]]] = []
+    for idx, art in lane:
+        spec = art.get("spec") or {}
+        pkg = spec.get("package") if isinstance(spec, dict) else None
+        if isinstance(pkg, str) and pkg.strip():
+            batch.append((idx, spec))
+        else:
+            out.append((idx, _install_artifact(uid, idx, art, tdir)))
+
+    if batch:
+        step_name = "artifact[pypi*]:batch"
+        try:
+            res = _install_pypi_batch([spec for _, spec in batch])
+            if log.isEnabledFor(logging.INFO):
+                log.info("artifact.done", extra={"uid": uid, "step": step_name, "ok": res.ok})
+        except Exception as e:
+            log.exception("Failed step %s", step_name)
+            res = StepResult(step=step_name, ok=False, stderr=str(e))
+        out.append((batch[0][0], res))
+    return out
+
+
+def _install_artifacts(uid: str, artifacts: Sequence[dict], tdir: Path) -> List[StepResult]:
+    """
+    Install artifacts concurrently, one thread per lane (steps within a lane
+    run in manifest order). Multiple pypi artifacts collapse into one
+    batched pip/uv call and so one result. Results are in manifest order.
+    """
+    if len(artifacts) <= 1:
+        return [_install_artifact(uid, idx, art, tdir) for idx, art in enumerate(artifacts)]
+
+    lanes = _artifact_lanes(artifacts, tdir)
+
+    def run_lane(key: Hashable, lane: List[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, StepResult]]:
+        if key == "pypi" and len(lane) > 1:
+            return _install_pypi_lane(uid, lane, tdir)
+        return [(idx, _install_artifact(uid, idx, art, tdir)) for idx, art in lane]
+
+    done: List[Tuple[int, StepResult]] = []
+    with ThreadPoolExecutor(max_workers=min(_ARTIFACT_MAX_WORKERS, len(lanes))) as ex:
+        futures = [ex.submit(run_lane, key, lane) for key, lane in lanes]
+        for fut in as_completed(futures):
+            done.extend(fut.result())
+
+    done.sort(key=lambda pair: pair[0])
+    return [res for _, res in done]
+
+
 def install_inline_manifest(
     db: Session,  # kept for API symmetry and (now) DB persist
     uid: str,
@@ -103,17 +286,25 @@ def install_inline_manifest(
     if not isinstance(manifest, dict):
         raise InstallError("Inline manifest must be a JSON object (dict).")
 
-    mtype = (manifest.get("type") or "").strip()
-    mid = (manifest.get("id") or "").strip()
-    ver = (manifest.get("version") or "").strip()
+    get = manifest.get
+    mtype = (get("type") or "").strip()
+    mid = (get("id") or "").strip()
+    ver = (get("version") or "").strip()
 
     if not (mtype and mid and ver):
         raise InstallError("Inline manifest missing required keys: 'type', 'id', 'version'.")
 
-    log.debug("inline.start", extra={"uid": uid, "source_url": source_url, "target": target})
+    # Read each remaining field once; the empty tuple avoids copying the list.
+    name = get("name") or ""
+    artifacts: Sequence[dict] = get("artifacts") or ()
+    adapters = get("adapters")
+    reg = get("mcp_registration")
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("inline.start", extra={"uid": uid, "source_url": source_url, "target": target})
 
     # Create a pseudo-entity for consistent lockfile/plan shape
-    ent = Entity(uid=uid, type=mtype, name=manifest.get("name") or "", version=ver)
+    ent = Entity(uid=uid, type=mtype, name=name, version=ver)
 
     # Build install plan
     plan = _build_install_plan(manifest)
@@ -121,35 +312,14 @@ def install_inline_manifest(
     files_written: List[str] = []
 
     # Ensure target directory exists
-    tdir = Path(target).expanduser().resolve()
-    tdir.mkdir(parents=True, exist_ok=True)
+    tdir = _resolve_target(target)
 
     # Artifacts
-    artifacts: List[dict] = list(manifest.get("artifacts") or [])
-    for idx, art in enumerate(artifacts):
-        kind = (art.get("kind") or "").strip().lower()
-        spec = art.get("spec") or {}
-        step_name = f"artifact[{idx}]:{kind}"
-
-        try:
-            if kind == "pypi":
-                results.append(_install_pypi(spec))
-            elif kind == "oci":
-                results.append(_install_oci(spec))
-            elif kind == "git":
-                results.append(_install_git(spec, tdir))
-            elif kind == "zip":
-                results.append(_install_zip(spec, tdir))
-            else:
-                results.append(StepResult(step=step_name, ok=False, stderr=f"Unsupported artifact kind: {kind}"))
-            log.info("artifact.done", extra={"uid": uid, "step": step_name, "ok": results[-1].ok})
-        except Exception as e:
-            log.exception("Failed step %s", step_name)
-            results.append(StepResult(step=step_name, ok=False, stderr=str(e)))
+    results.extend(_install_artifacts(uid, artifacts, tdir))
 
     # Adapters (optional)
     try:
-        if write_adapters and manifest.get("adapters"):
+        if write_adapters and adapters:
             adapter_files = write_adapters(manifest, target=str(tdir)) or []
             files_written.extend([_relpath_or_abs(p, tdir) for p in adapter_files])
             results.append(StepResult(step="adapters.write", ok=True, extra={"count": len(adapter_files)}))
@@ -166,15 +336,19 @@ def install_inline_manifest(
             results.append(StepResult(step="gateway.register", ok=True, extra=reg_res))
         else:
             results.append(StepResult(step="gateway.register", ok=True, extra={"skipped": True}))
-        log.info("gateway.register", extra={"uid": uid, "ok": True, "skipped": reg_res is None})
+        if log.isEnabledFor(logging.INFO):
+            log.info("gateway.register", extra={"uid": uid, "ok": True, "skipped": reg_res is None})
     except Exception as e:
         log.exception("Gateway registration failed")
         results.append(StepResult(step="gateway.register", ok=False, stderr=str(e)))
 
     # (NEW) Persist catalog entity to DB for inline installs
-    # Mirrors the DB-backed flow: map manifest → Entity row via save_entity()
+    # Mirrors the DB-backed flow: map manifest → Entity row via save_entity().
+    # Changes are only staged here; one commit at the end covers them all, and
+    # the catalog.save step is reported (in this slot) once that commit lands.
+    save_idx: Optional[int] = None
     try:
-        saved = save_entity(manifest, db)  # idempotent upsert
+        saved = save_entity(manifest, db, commit=False)  # idempotent upsert
         # Enrich with provenance + registration blob for later sync
         if source_url:
             try:
@@ -182,7 +356,6 @@ def install_inline_manifest(
             except Exception:
                 # Model may not have source_url in older schemas; soft-fail
                 pass
-        reg = manifest.get("mcp_registration")
         if isinstance(reg, dict):
             try:
                 # Some deployments add this column via migration
@@ -196,16 +369,14 @@ def install_inline_manifest(
         except Exception:
             pass
         db.add(saved)
-        db.commit()
-        log.info("catalog.save", extra={"uid": uid, "ok": True})
-        results.append(StepResult(step="catalog.save", ok=True))
+        save_idx = len(results)
     except Exception as e:
         db.rollback()
         log.exception("Failed to save inline entity to DB")
         results.append(StepResult(step="catalog.save", ok=False, stderr=str(e)))
 
     # Lockfile
-    lockfile_data = _build_lockfile(ent, manifest, artifacts)
+    lockfile_data = _build_lockfile(ent, manifest, artifacts or [])
     try:
         lf_path = _write_lockfile(tdir, lockfile_data)
         files_written.append(_relpath_or_abs(lf_path, tdir))
@@ -214,10 +385,24 @@ def install_inline_manifest(
         log.exception("Failed to write lockfile")
         results.append(StepResult(step="lockfile.write", ok=False, stderr=str(e)))
 
-    log.debug("inline.end", extra={"uid": uid, "steps": [r.step for r in results]})
+    # Single transactional commit for everything staged above.
+    if save_idx is not None:
+        try:
+            db.commit()
+            if log.isEnabledFor(logging.INFO):
+                log.info("catalog.save", extra={"uid": uid, "ok": True})
+            save_step = StepResult(step="catalog.save", ok=True)
+        except Exception as e:
+            db.rollback()
+            log.exception("Failed to commit inline entity to DB")
+            save_step = StepResult(step="catalog.save", ok=False, stderr=str(e))
+        results.insert(save_idx, save_step)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("inline.end", extra={"uid": uid, "steps": [r.step for r in results]})
     return {
         "plan": plan,
-        "results": [asdict(r) for r in results],
+        "results": [_step_to_dict(r) for r in results],
         "files_written": files_written,
         "lockfile": lockfile_data,
     }
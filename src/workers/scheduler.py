@@ -18,24 +18,53 @@ Design notes
 
 from __future__ import annotations
 
+import inspect
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
 from fastapi import FastAPI
 
 from ..config import settings
-from ..db import SessionLocal
+from ..db import SessionLocal, create_background_engine, create_background_sessionmaker
 
 log = logging.getLogger(__name__)
 
+# Dedicated NullPool engine and session factory for ingest cycles, created by
+# start_scheduler(); cycles run outside the scheduler use SessionLocal.
+_ingest_engine = None
+_IngestSession = None
+
+# Optional C-accelerated JSON for log compaction / remote parsing.
 try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys; stdlib is more forgiving
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    from apscheduler.executors.pool import ThreadPoolExecutor as APSThreadPoolExecutor  # type: ignore
     from apscheduler.schedulers.background import BackgroundScheduler  # type: ignore
     from apscheduler.triggers.interval import IntervalTrigger  # type: ignore
 
     _HAS_APSCHEDULER = True
 except Exception:  # pragma: no cover
+    APSThreadPoolExecutor = None  # type: ignore
     BackgroundScheduler = None  # type: ignore
     IntervalTrigger = None  # type: ignore
     _HAS_APSCHEDULER = False
@@ -66,8 +95,17 @@ def start_scheduler(app: FastAPI) -> None:
         log.debug("Scheduler already present; skipping start.")
         return
 
+    # Ingest gets its own unpooled engine so a long cycle never starves the
+    # request pool.
+    global _ingest_engine, _IngestSession
+    _ingest_engine = create_background_engine()
+    _IngestSession = create_background_sessionmaker(_ingest_engine)
+
     # Configure the background scheduler
+    # A single job that never overlaps needs a single worker thread (the default
+    # pool is 10); the per-remote fan-out happens inside _run_ingest_cycle.
     scheduler = BackgroundScheduler(
+        executors={"default": APSThreadPoolExecutor(max_workers=1)},
         timezone=timezone.utc,
         job_defaults={
             "coalesce": True,        # if delayed, run once for skipped intervals
@@ -121,6 +159,7 @@ def stop_scheduler(app: FastAPI) -> None:
     """
     Stop the scheduler if present.
     """
+    global _ingest_engine, _IngestSession
     sched = getattr(app.state, "scheduler", None)
     if not sched:
         return
@@ -131,41 +170,72 @@ def stop_scheduler(app: FastAPI) -> None:
         log.exception("Failed to stop scheduler cleanly.")
     finally:
         app.state.scheduler = None
+        _IngestSession = None
+        if _ingest_engine is not None:
+            try:
+                _ingest_engine.dispose()
+            except Exception:
+                pass
+            _ingest_engine = None
 
 
 # --------------------------------------------------------------------------------------
 # Core cycle
 # --------------------------------------------------------------------------------------
 
+def _ingest_workers(n_urls: int) -> int:
+    """
+    Worker count for one cycle: settings.INGEST_CONCURRENCY, capped by the
+    number of remotes. SQLite allows a single writer, so it always gets one.
+    Concurrent remotes that publish the same uid are not serialised against
+    each other; the loser of that upsert race fails with IntegrityError.
+    """
+    if str(settings.DATABASE_URL or "").startswith("sqlite"):
+        return 1
+    return max(1, min(int(settings.INGEST_CONCURRENCY or 1), n_urls))
+
+
 def _run_ingest_cycle(app: FastAPI) -> None:
     """
     One ingest pass over all configured remotes.
-    Uses a dedicated DB session and releases it at the end.
+    Remotes run concurrently (settings.INGEST_CONCURRENCY), one DB session each.
     """
     urls = _current_remotes(app)
     if not urls:
         log.debug("No remotes configured; skipping ingest cycle.")
-    return
+        return
 
     log.info("Ingest cycle starting for %d remote(s).", len(urls))
     ok_count = 0
     err_count = 0
 
-    db = SessionLocal()
-    try:
-        for url in urls:
+    # Remotes are independent, so fetch them concurrently. Sessions are not
+    # thread-safe: every remote gets its own, closed by its worker.
+    workers = _ingest_workers(len(urls))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as ex:
+        future_map = {ex.submit(_ingest_one_in_session, url): url for url in urls}
+        for fut in as_completed(future_map):
+            url = future_map[fut]
             try:
-                stats = _ingest_one(db, url)
+                stats = fut.result()
                 ok_count += 1
-                # Keep logs compact but useful
-                if isinstance(stats, dict) and stats:
-                    log.info("Ingest OK: %s stats=%s", url, _compact(stats))
-                else:
-                    log.info("Ingest OK: %s", url)
+                # Keep logs compact but useful; skip the JSON dump when INFO is off.
+                if log.isEnabledFor(logging.INFO):
+                    if isinstance(stats, dict) and stats:
+                        log.info("Ingest OK: %s stats=%s", url, _compact(stats))
+                    else:
+                        log.info("Ingest OK: %s", url)
             except Exception as e:
                 err_count += 1
                 log.exception("Ingest failed for %s: %s", url, e)
-        log.info("Ingest cycle complete: ok=%d, errors=%d.", ok_count, err_count)
+    log.info("Ingest cycle complete: ok=%d, errors=%d.", ok_count, err_count)
+
+
+def _ingest_one_in_session(url: str) -> Dict[str, Any] | None:
+    """Run _ingest_one for one remote on a dedicated DB session."""
+    db = (_IngestSession or SessionLocal)()
+    try:
+        return _ingest_one(db, url)
     finally:
         try:
             db.close()
@@ -181,20 +251,22 @@ def _current_remotes(app: FastAPI) -> List[str]:
     """
     Prefer process‑local runtime set (mutated by /catalog/remotes). Fall back to settings.
     """
-    urls: List[str] = []
     state_remotes = getattr(app.state, "remotes", None)
     if isinstance(state_remotes, (set, list, tuple)):
-        urls = [str(u).strip() for u in state_remotes if str(u).strip()]
+        urls: Iterable[str] = _clean_urls(state_remotes)
     else:
         urls = _parse_remotes(settings.MATRIX_REMOTES)
     # De‑dup while preserving order
-    seen = set()
-    out: List[str] = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
-    return out
+    return list(dict.fromkeys(urls))
+
+
+def _clean_urls(items: Iterable[Any]) -> Iterator[str]:
+    """Stringify + strip each item, dropping blanks (each item stripped once)."""
+    return (u for u in (str(x).strip() for x in items) if u)
+
+
+# Values meaning "no remotes" (the test/CI default is "[]"); skip parsing them.
+_EMPTY_REMOTES_LITERALS = frozenset(("", "[]", "null"))
 
 
 def _parse_remotes(raw: Any) -> List[str]:
@@ -202,69 +274,111 @@ def _parse_remotes(raw: Any) -> List[str]:
     Accepts list/tuple, JSON string (array), or CSV string; returns list[str].
     """
     if isinstance(raw, (list, tuple)):
-        return [str(u).strip() for u in raw if str(u).strip()]
+        return list(_clean_urls(raw))
     if isinstance(raw, str):
         s = raw.strip()
-        if not s:
+        if s in _EMPTY_REMOTES_LITERALS:
             return []
         try:
-            arr = json.loads(s)
+            arr = _loads(s)
             if isinstance(arr, list):
-                return [str(u).strip() for u in arr if str(u).strip()]
+                return list(_clean_urls(arr))
         except Exception:
             # fallback CSV
-            return [u.strip() for u in s.split(",") if u.strip()]
+            return list(_clean_urls(s.split(",")))
     return []
 
 
-def _ingest_one(db, url: str) -> Dict[str, Any] | None:
+# Single-remote ingest entry points, preferred names first.
+_INGEST_CANDIDATES = (
+    ("ingest_index", "kw2"),  # func(db=db, index_url=url)
+    ("ingest_remote", "pos"), # func(db, url)
+    ("ingest", "pos"),
+    ("sync_once", "pos"),
+    ("sync_remote", "pos"),
+)
+# Batch fallback (functions that accept a list)
+_BATCH_CANDIDATES = ("ingest_many", "sync_remotes", "sync_all")
+
+
+@lru_cache(maxsize=1)
+def _get_ingest_mod() -> ModuleType:
     """
-    Dispatch to whichever ingest function is available in src.services.ingest,
-    mirroring the compatibility layer used in routes/remotes.py.
+    Import src.services.ingest on first use (keeps scheduler import‑light).
+    lru_cache makes concurrent first calls safe and later calls a dict hit.
+    """
+    from ..services import ingest as ingest_mod
+
+    return ingest_mod
+
+
+@lru_cache(maxsize=1)
+def _resolve_ingest_fn() -> Tuple[Callable[..., Any], str]:
+    """
+    Pick the ingest function exported by src.services.ingest once; the set of
+    exported names is fixed after import. Call _resolve_ingest_fn.cache_clear()
+    (and _resolve_ingest_call.cache_clear()) after reloading that module.
     """
-    from ..services import ingest as ingest_mod  # local import to keep scheduler import‑light
-
-    # Preferred names first
-    candidates = [
-        ("ingest_index", "kw2"),  # func(db=db, index_url=url)
-        ("ingest_remote", "pos"), # func(db, url)
-        ("ingest", "pos"),
-        ("sync_once", "pos"),
-        ("sync_remote", "pos"),
-    ]
-
-    for fname, style in candidates:
+    ingest_mod = _get_ingest_mod()
+
+    for fname, style in _INGEST_CANDIDATES:
         fn = getattr(ingest_mod, fname, None)
         if callable(fn):
-            try:
-                if style == "pos":
-                    return fn(db, url)
-                if style == "kw2":
-                    return fn(db=db, index_url=url)
-                # Fallback permutations
-            except TypeError:
-                try:
-                    return fn(db=db, url=url)  # type: ignore
-                except Exception:
-                    pass
-                try:
-                    return fn(db=db, index_url=url)  # type: ignore
-                except Exception:
-                    pass
-            # Other exceptions bubble to caller
-            raise
-
-    # Batch fallback (functions that accept a list)
-    for fname in ("ingest_many", "sync_remotes", "sync_all"):
+            return fn, _call_style(fn, style)
+    for fname in _BATCH_CANDIDATES:
         fn = getattr(ingest_mod, fname, None)
         if callable(fn):
+            return fn, "batch"
+    raise RuntimeError("No compatible ingest function found in src.services.ingest")
+
+
+def _call_style(fn: Callable[..., Any], default: str) -> str:
+    """
+    Work out once how to pass (db, url) from fn's signature:
+    "kw2" -> fn(db=, index_url=), "kw1" -> fn(db=, url=), "pos" -> fn(db, url).
+    """
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):  # builtins / C callables without a signature
+        return default
+    if "db" in params and "index_url" in params:
+        return "kw2"
+    if "db" in params and "url" in params:
+        return "kw1"
+    return "pos"
+
+
+@lru_cache(maxsize=1)
+def _resolve_ingest_call() -> Callable[[Any, str], Dict[str, Any] | None]:
+    """
+    Specialise the (fn, style) pair into a plain (db, url) caller once, so a
+    cycle's per-URL calls skip the style branches. Shares cache lifetime with
+    _resolve_ingest_fn (clear both after reloading src.services.ingest).
+    """
+    fn, style = _resolve_ingest_fn()
+
+    if style == "batch":
+        def _call(db, url: str) -> Dict[str, Any] | None:
             out = fn(db, [url])  # type: ignore
             if isinstance(out, list) and out:
                 first = out[0]
                 return first if isinstance(first, dict) else {"result": first}
             return out if isinstance(out, dict) else {"result": out}
 
-    raise RuntimeError("No compatible ingest function found in src.services.ingest")
+        return _call
+    if style == "kw2":
+        return lambda db, url: fn(db=db, index_url=url)
+    if style == "kw1":
+        return lambda db, url: fn(db=db, url=url)
+    return fn
+
+
+def _ingest_one(db, url: str) -> Dict[str, Any] | None:
+    """
+    Dispatch to whichever ingest function is available in src.services.ingest,
+    mirroring the compatibility layer used in routes/remotes.py.
+    """
+    return _resolve_ingest_call()(db, url)
 
 
 def _compact(obj: Dict[str, Any], max_len: int = 256) -> str:
@@ -272,7 +386,7 @@ def _compact(obj: Dict[str, Any], max_len: int = 256) -> str:
     Compact dict → single‑line JSON truncated for logs.
     """
     try:
-        s = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+        s = _dumps(obj)
         return s if len(s) <= max_len else s[:max_len] + "…"
     except Exception:
         return str(obj)[:max_len]
@@ -12,15 +12,17 @@ Goals
 
 Notes
 -----
-Individual tests may still override the DB session dependency or set their own
-DATABASE_URLs. We simply provide safe defaults here so importing `src.app`
-doesn't try to reach external services.
+All environment defaults live here (test modules do not set their own), so
+every `src.*` import sees the same configuration. Individual tests may still
+override the DB session dependency; importing `src.app` never tries to reach
+external services.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, List
 
@@ -34,6 +36,7 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///./ci.sqlite")
 
 # Disable remote ingestion & background scheduler for tests.
 os.environ.setdefault("CATALOG_REMOTES", "[]")
+os.environ.setdefault("MATRIX_REMOTES", "[]")
 os.environ.setdefault("INGEST_INTERVAL_MIN", "0")
 os.environ.setdefault("INGEST_SCHED_ENABLED", "false")
 
@@ -69,12 +72,81 @@ logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
 # ---------------------------------------------------------------------
-# Optional FastAPI TestClient fixture (most tests import app directly)
+# Shared in-memory SQLite engine for module-level DB fixtures
 # ---------------------------------------------------------------------
-@pytest.fixture
+# One named, shared-cache in-memory database for the whole run: the schema is
+# built once and no .sqlite files are written. StaticPool keeps the single
+# connection (and therefore the database) alive across checkouts/threads.
+TEST_DB_URL = "sqlite+pysqlite:///file:matrixhub_test?mode=memory&cache=shared&uri=true"
+
+
+def _enable_sqlite_savepoints(engine) -> None:
+    """
+    pysqlite defers BEGIN to the first DML statement, which breaks SAVEPOINT
+    isolation (a released savepoint commits). Hand transaction control to
+    SQLAlchemy instead, per the SQLAlchemy pysqlite docs.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "connect")
+    def _no_pysqlite_begin(dbapi_con, _):
+        dbapi_con.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def _tune_sqlite_pragmas(engine) -> None:
+    """
+    Test databases are disposable: skip fsyncs and keep journal/temp data in
+    memory. locking_mode=EXCLUSIVE is left out because the shared-cache DB is
+    used from the TestClient's worker threads too.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_con, _):
+        cur = dbapi_con.cursor()
+        try:
+            cur.execute("PRAGMA synchronous=OFF")
+            cur.execute("PRAGMA journal_mode=MEMORY")
+            cur.execute("PRAGMA temp_store=MEMORY")
+            cur.execute("PRAGMA cache_size=-64000")
+        finally:
+            cur.close()
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Session-wide in-memory engine with the ORM schema created once."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    from src.models import Base
+
+    eng = create_engine(
+        TEST_DB_URL,
+        future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    _tune_sqlite_pragmas(eng)
+    _enable_sqlite_savepoints(eng)
+    Base.metadata.create_all(eng)
+    yield eng
+    eng.dispose()
+
+
+# ---------------------------------------------------------------------
+# Shared FastAPI TestClient (one per test session)
+# ---------------------------------------------------------------------
+@pytest.fixture(scope="session")
 def client():
     """
-    Provide a ready-to-use TestClient if a test prefers DI style.
+    Provide a ready-to-use TestClient, built once for the whole session.
+    Not entered as a context manager, so app lifespan startup is not run
+    (same as the per-module clients tests used before).
 
     Usage:
         def test_health(client):
@@ -96,7 +168,7 @@ def _cleanup_sqlite_files() -> Generator[None, None, None]:
     Remove common SQLite files produced by tests to keep the workspace clean.
     """
     # Pre-clean to avoid state leakage between runs
-    for p in ("./ci.sqlite", "./test_ci.sqlite", "./test_search.sqlite", "./test_install.sqlite"):
+    for p in ("./ci.sqlite", "./test_ci.sqlite"):
         try:
             Path(p).unlink(missing_ok=True)
         except Exception:
@@ -108,8 +180,6 @@ def _cleanup_sqlite_files() -> Generator[None, None, None]:
     candidates: List[Path] = [
         Path("./ci.sqlite"),
         Path("./test_ci.sqlite"),
-        Path("./test_search.sqlite"),
-        Path("./test_install.sqlite"),
     ]
     for p in candidates:
         try:
@@ -143,18 +213,65 @@ def _ensure_scheduler_stopped() -> Generator[None, None, None]:
         pass
 
 
-# --- DB Session fixture -------------------------------------------------------
-@pytest.fixture
-def session():
+# --- DB Session fixtures ------------------------------------------------------
+@contextmanager
+def _outer_transaction(engine):
     """
-    Provide a real SQLAlchemy Session bound to the test database.
-    Uses src.db init to ensure schema is present.
+    Yield a connection inside a transaction that is always rolled back, so the
+    shared in-memory engine is left as we found it.
     """
-    from src.db import init_db, SessionLocal
-
-    init_db()            # builds engine(s) and ensures schema
-    db = SessionLocal()  # write-capable session
+    conn = engine.connect()
+    trans = conn.begin()
     try:
-        yield db
+        yield conn
     finally:
-        db.close()
+        if trans.is_active:
+            trans.rollback()
+        conn.close()
+
+
+def _savepoint_sessionmaker(conn):
+    # Session commits become SAVEPOINT releases inside the outer transaction.
+    from sqlalchemy.orm import sessionmaker
+
+    return sessionmaker(
+        bind=conn,
+        autoflush=False,
+        future=True,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.fixture
+def session(engine):
+    """
+    Provide a real SQLAlchemy Session on the shared in-memory test engine.
+
+    The session runs inside an outer transaction on a dedicated connection and
+    turns its own commits into SAVEPOINTs, so everything a test writes is
+    discarded by a single rollback on teardown (no per-test DDL or deletes).
+    The app's own src.db engine is left untouched.
+    """
+    with _outer_transaction(engine) as conn:
+        db = _savepoint_sessionmaker(conn)()
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+@pytest.fixture(scope="module")
+def module_conn(engine):
+    """
+    One outer transaction for a whole test module, for modules that seed data
+    once and share it across tests; rolled back when the module finishes.
+    """
+    with _outer_transaction(engine) as conn:
+        yield conn
+
+
+@pytest.fixture(scope="module")
+def module_sessionmaker(module_conn):
+    """Session factory bound to `module_conn` (commits become SAVEPOINTs)."""
+    return _savepoint_sessionmaker(module_conn)
@@ -0,0 +1,32 @@
+import pytest
+
+from src import config
+from src.services.search import engine
+from src.utils import security
+
+
+def test_reload_settings_rebinds_hot_path_snapshots(monkeypatch):
+    before = config.settings
+    try:
+        with monkeypatch.context() as m:
+            m.setenv("SEARCH_LEXICAL_BACKEND", "pgtrgm")
+            m.setenv("API_TOKEN", "s3cret")
+            assert config.reload_settings() is before
+
+            assert config.settings.SEARCH_LEXICAL_BACKEND == "pgtrgm"
+            assert engine._LEXICAL_BACKEND == "pgtrgm"
+            assert security.is_auth_enabled()
+    finally:
+        config.reload_settings()
+
+    assert engine._LEXICAL_BACKEND == "none"
+    assert not security.is_auth_enabled()
+
+
+def test_invalid_environment_leaves_settings_untouched(monkeypatch):
+    backend = config.settings.SEARCH_LEXICAL_BACKEND
+    monkeypatch.setenv("SEARCH_LEXICAL_BACKEND", "not-a-backend")
+
+    with pytest.raises(config.ValidationError):
+        config.reload_settings()
+    assert config.settings.SEARCH_LEXICAL_BACKEND == backend
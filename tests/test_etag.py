@@ -0,0 +1,50 @@
+from src.utils import etag
+
+
+def test_etag_tracks_mutation():
+    payload = {"items": [1, 2]}
+    before = etag.weak_etag(payload)
+    payload["items"].append(3)
+
+    assert etag.weak_etag(payload) != before
+
+
+def test_weak_and_strong_etag_share_digest():
+    payload = {"b": 2, "a": 1}
+    strong = etag.strong_etag(payload)
+
+    assert etag.weak_etag(payload) == f"W/{strong}"
+    # Canonical serialization: key order does not change the ETag.
+    assert etag.strong_etag({"a": 1, "b": 2}) == strong
+
+
+def test_http_date_is_rfc7231_imf_fixdate():
+    from email.utils import parsedate_to_datetime
+
+    etag._http_date.cache_clear()
+    value = etag._http_date(784111777)
+
+    assert value == "Sun, 06 Nov 1994 08:49:37 GMT"
+    assert parsedate_to_datetime(value).timestamp() == 784111777
+    assert etag._http_date(784111777) is value  # served from the cache
+    assert etag._http_date.cache_info().hits == 1
+
+
+def test_etag_matches_wildcard_single_and_lists():
+    tag = 'W/"abc"'
+    assert etag._etag_matches(tag, "*")
+    assert etag._etag_matches(tag, " * ")
+    assert etag._etag_matches(tag, 'W/"abc"')
+    assert etag._etag_matches(tag, '"x", W/"abc"')
+    assert etag._etag_matches(tag, '"x",W/"abc",')
+    assert etag._etag_matches(tag, '"x", *')
+    assert not etag._etag_matches(tag, '"x", "y"')
+    assert not etag._etag_matches(tag, "")
+
+
+def test_etag_matches_keeps_weak_and_strong_apart():
+    # Exact, case-sensitive comparison, as before the single-value fast path.
+    assert not etag._etag_matches('W/"abc"', '"abc"')
+    assert not etag._etag_matches('"abc"', 'W/"abc"')
+    assert not etag._etag_matches('"abc"', '"ABC"')
+    assert etag._etag_matches('"abc"', '"abc"')
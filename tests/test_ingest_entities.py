@@ -1,14 +1,10 @@
 # tests/test_ingest_entities.py
 from __future__ import annotations
 
-from datetime import datetime
-
-import pytest
 from sqlalchemy import select
 
-from src.models import Entity
-
-pytestmark = pytest.mark.skip(reason="Requires full DB session fixture — not yet wired")
+# Any valid ISO timestamp will do; it does not need to be "now".
+RELEASE_TS = "2024-01-01T00:00:00"
 
 
 def test_ingest_basic_server(session):
@@ -33,11 +29,12 @@ def test_ingest_basic_server(session):
             },
             "server": {"name": "hello-sse-server", "transport": "SSE", "url": "http://localhost:8000/"},
         },
-        "release_ts": datetime.utcnow().isoformat(),
+        "release_ts": RELEASE_TS,
     }
 
     # Import save_entity after fixtures configured DB
     from src.db import save_entity
+    from src.models import Entity
 
     ent = save_entity(manifest, session)  # should commit
     assert ent.uid == "mcp_server:hello-sse-server@0.1.0"
@@ -1,39 +1,72 @@
 import json
-import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert
 
-# Local DB for CI
-os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///./test_install.sqlite")
-os.environ.setdefault("MATRIX_REMOTES", "[]")
+try:  # optional accelerator (perf extra); stdlib json also parses bytes
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
-from src.models import Base, Entity
-from src.services import install as installer
+_loads = orjson.loads if orjson is not None else json.loads
 
 
 @pytest.fixture(scope="module")
-def engine():
-    eng = create_engine("sqlite+pysqlite:///./test_install.sqlite", future=True)
-    Base.metadata.create_all(eng)
-    yield eng
-    Base.metadata.drop_all(eng)
+def installer():
+    # Imported on first use so collecting/selecting other tests stays light.
+    from src.services import install
 
+    return install
 
-@pytest.fixture(scope="module")
-def Session(engine):
-    return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
+# Manifest served by the stubbed loader (avoids network)
+MANIFEST = {
+    "schema_version": 1,
+    "type": "agent",
+    "id": "test-agent",
+    "name": "Test Agent",
+    "version": "0.1.0",
+    "description": "Used for install tests.",
+    "artifacts": [],  # keep empty to avoid external commands
+    "adapters": [
+        {"framework": "langgraph", "template_key": "langgraph-node", "params": {"class_name": "TestNode"}}
+    ],
+    "mcp_registration": {
+        "tool": {
+            "name": "test_tool",
+            "integration_type": "REST",
+            "request_type": "POST",
+            "url": "http://localhost:9999/invoke",
+            "input_schema": {"type": "object"},
+        }
+    },
+}
 
-@pytest.fixture
-def db(Session):
-    db = Session()
-    try:
-        yield db
-    finally:
-        db.close()
+
+def _fake_write_adapters(mfest, target: str):
+    p = Path(target) / "src" / "flows" / "test_node.py"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text("# generated", encoding="utf-8")
+    return [str(p)]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stub_installer(installer):
+    # Patch loader, adapter writer and gateway wrappers once for the module.
+    with patch.multiple(
+        installer,
+        create=True,
+        _load_manifest=lambda entity: MANIFEST,
+        write_adapters=_fake_write_adapters,
+        register_tool=lambda *a, **k: {"ok": True},
+        register_server=lambda *a, **k: {"ok": True},
+        register_resources=lambda *a, **k: [],
+        register_prompts=lambda *a, **k: [],
+        trigger_discovery=lambda *a, **k: {"status": "ok"},
+    ):
+        yield
 
 
 @pytest.fixture
@@ -43,66 +76,30 @@ def project_dir(tmp_path: Path) -> Path:
 
 
 @pytest.fixture(autouse=True)
-def seed_entity(db):
-    db.query(Entity).delete()
-    e = Entity(
-        uid="agent:test-agent@0.1.0",
-        type="agent",
-        name="Test Agent",
-        version="0.1.0",
-        summary="A test agent.",
-        description="Used for install flow tests.",
-        source_url="https://example.invalid/manifest.yaml",  # will be stubbed
+def seed_entity(session):
+    from src.models import Entity
+
+    session.execute(
+        insert(Entity),
+        [
+            dict(
+                uid="agent:test-agent@0.1.0",
+                type="agent",
+                name="Test Agent",
+                version="0.1.0",
+                summary="A test agent.",
+                description="Used for install flow tests.",
+                source_url="https://example.invalid/manifest.yaml",  # will be stubbed
+            )
+        ],
     )
-    db.add(e)
-    db.commit()
+    session.commit()
     yield
 
 
-def test_install_plan_and_lockfile(db, project_dir, monkeypatch):
-    # Stub manifest loader to avoid network
-    manifest = {
-        "schema_version": 1,
-        "type": "agent",
-        "id": "test-agent",
-        "name": "Test Agent",
-        "version": "0.1.0",
-        "description": "Used for install tests.",
-        "artifacts": [],  # keep empty to avoid external commands
-        "adapters": [
-            {"framework": "langgraph", "template_key": "langgraph-node", "params": {"class_name": "TestNode"}}
-        ],
-        "mcp_registration": {
-            "tool": {
-                "name": "test_tool",
-                "integration_type": "REST",
-                "request_type": "POST",
-                "url": "http://localhost:9999/invoke",
-                "input_schema": {"type": "object"},
-            }
-        },
-    }
-
-    monkeypatch.setattr(installer, "_load_manifest", lambda entity: manifest)
-
-    # Stub adapters writer
-    def _fake_write_adapters(mfest, target: str):
-        p = Path(target) / "src" / "flows" / "test_node.py"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text("# generated", encoding="utf-8")
-        return [str(p)]
-
-    monkeypatch.setattr(installer, "write_adapters", _fake_write_adapters)
-
-    # Stub gateway client wrappers (no-ops)
-    monkeypatch.setattr(installer, "register_tool", lambda *a, **k: {"ok": True}, raising=False)
-    monkeypatch.setattr(installer, "register_server", lambda *a, **k: {"ok": True}, raising=False)
-    monkeypatch.setattr(installer, "register_resources", lambda *a, **k: [], raising=False)
-    monkeypatch.setattr(installer, "register_prompts", lambda *a, **k: [], raising=False)
-    monkeypatch.setattr(installer, "trigger_discovery", lambda *a, **k: {"status": "ok"}, raising=False)
-
+def test_install_plan_and_lockfile(session, project_dir, installer):
     result = installer.install_entity(
-        db=db,
+        db=session,
         entity_id="agent:test-agent",
         version="0.1.0",
         target=str(project_dir),
@@ -121,5 +118,238 @@ def test_install_plan_and_lockfile(db, project_dir, monkeypatch):
     # Ensure lockfile actually written
     lf = project_dir / "matrix.lock.json"
     assert lf.exists()
-    data = json.loads(lf.read_text(encoding="utf-8"))
+    data = _loads(lf.read_bytes())
     assert data.get("version") == 1
+
+
+def test_inline_artifacts_keep_manifest_order(tmp_path, monkeypatch):
+    import time
+
+    from src.utils import tools
+    from src.services.install import StepResult
+
+    def _fake(kind, delay):
+        def run(spec, *args):
+            time.sleep(delay)
+            return StepResult(step=f"{kind}:{spec['n']}", ok=True)
+        return run
+
+    # Later artifacts finish first; results must still follow manifest order.
+    monkeypatch.setattr(tools, "_install_oci", _fake("oci", 0.05))
+    monkeypatch.setattr(tools, "_install_git", _fake("git", 0.02))
+    monkeypatch.setattr(tools, "_install_zip", _fake("zip", 0.0))
+
+    artifacts = [
+        {"kind": "oci", "spec": {"n": 0}},
+        {"kind": "git", "spec": {"n": 1, "repo": "a"}},
+        {"kind": "zip", "spec": {"n": 2}},
+        {"kind": "bogus", "spec": {}},
+        {"kind": "zip", "spec": {"n": 4}},
+    ]
+    results = tools._install_artifacts("agent:x@1", artifacts, tmp_path)
+
+    assert [r.step for r in results] == ["oci:0", "git:1", "zip:2", "artifact[3]:bogus", "zip:4"]
+    assert [r.ok for r in results] == [True, True, True, False, True]
+
+
+def test_inline_malformed_artifact_fails_on_its_own(tmp_path, monkeypatch):
+    from src.utils import tools
+    from src.services.install import StepResult
+
+    monkeypatch.setattr(tools, "_install_zip", lambda spec, tdir: StepResult(step="zip", ok=True))
+    monkeypatch.setattr(tools, "_install_oci", lambda spec: StepResult(step="oci", ok=True))
+
+    artifacts = [
+        {"kind": "git", "spec": "https://example.invalid/repo.git"},
+        {"kind": "zip", "spec": {"dest": ["not", "hashable"]}},
+        {"kind": "oci", "spec": {"image": "x"}},
+    ]
+    results = tools._install_artifacts("agent:x@1", artifacts, tmp_path)
+
+    assert [r.step for r in results] == ["artifact[0]:git", "zip", "oci"]
+    assert [r.ok for r in results] == [False, True, True]
+
+
+def test_artifacts_writing_same_directory_share_a_lane(tmp_path):
+    from src.utils import tools
+
+    artifacts = [
+        {"kind": "git", "spec": {"repo": "https://github.com/a/foo"}},
+        {"kind": "git", "spec": {"repo": "https://github.com/b/foo.git"}},
+        {"kind": "git", "spec": {"repo": "https://github.com/c/bar"}},
+        {"kind": "zip", "spec": {"url": "https://x/y.zip", "dest": "vendor_zip"}},
+        {"kind": "oci", "spec": {"image": "x"}},
+    ]
+    lanes = sorted(sorted(i for i, _ in members) for _, members in tools._artifact_lanes(artifacts, tmp_path))
+    # Both repos clone into vendor/foo; bar and the zip are independent.
+    assert lanes == [[0, 1], [2], [3], [4]]
+
+    # A zip extracted into vendor/ contains every git clone.
+    artifacts.append({"kind": "zip", "spec": {"url": "https://x/z.zip", "dest": "vendor"}})
+    lanes = sorted(sorted(i for i, _ in members) for _, members in tools._artifact_lanes(artifacts, tmp_path))
+    assert lanes == [[0, 1, 2, 5], [3], [4]]
+
+
+def test_inline_pypi_artifacts_share_one_pip_call(tmp_path, monkeypatch, installer):
+    from src.utils import tools
+    from src.services.install import StepResult
+
+    calls = []
+
+    def _fake_run_cmd(step, cmd, **kw):
+        calls.append(cmd)
+        return StepResult(step=step, ok=True, returncode=0)
+
+    monkeypatch.setattr(installer, "_run_cmd", _fake_run_cmd)
+
+    artifacts = [
+        {"kind": "pypi", "spec": {"package": "alpha", "version": "==1.0"}},
+        {"kind": "pypi", "spec": {}},
+        {"kind": "pypi", "spec": {"package": "beta"}},
+        {"kind": "pypi", "spec": {"package": "alpha", "version": "==1.0"}},
+    ]
+    results = tools._install_artifacts("agent:x@1", artifacts, tmp_path)
+
+    assert len(calls) == 1
+    assert calls[0][-2:] == ["alpha==1.0", "beta"]
+    assert [r.ok for r in results] == [True, False]
+    assert results[0].extra["packages"] == ["alpha==1.0", "beta"]
+
+
+def test_step_to_dict_matches_asdict(installer):
+    from dataclasses import asdict
+
+    r = installer.StepResult(step="pypi", ok=True, returncode=0, stdout="x", extra={"packages": ["a"]})
+    assert installer._step_to_dict(r) == asdict(r)
+
+
+INLINE = {"type": "tool", "id": "inline-tool", "name": "Inline Tool", "version": "1.0.0"}
+
+
+def test_inline_catalog_save_reported_after_commit(session, tmp_path):
+    from src.models import Entity
+    from src.utils import tools
+
+    out = tools.install_inline_manifest(session, "tool:inline-tool@1.0.0", dict(INLINE), str(tmp_path))
+
+    steps = [(r["step"], r["ok"]) for r in out["results"]]
+    assert steps == [("adapters.write", True), ("gateway.register", True), ("catalog.save", True), ("lockfile.write", True)]
+    assert session.get(Entity, "tool:inline-tool@1.0.0") is not None
+
+
+def test_inline_catalog_save_fails_when_commit_rolls_back(session, tmp_path, monkeypatch):
+    from src.models import Entity
+    from src.utils import tools
+
+    def _fail():
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(session, "commit", _fail)
+    out = tools.install_inline_manifest(session, "tool:inline-tool@1.0.0", dict(INLINE), str(tmp_path))
+
+    (save,) = [r for r in out["results"] if r["step"] == "catalog.save"]
+    assert save["ok"] is False and "database is locked" in save["stderr"]
+    assert not any(r["step"] == "db.commit" for r in out["results"])
+    monkeypatch.undo()
+    assert session.get(Entity, "tool:inline-tool@1.0.0") is None
+
+
+def test_resolve_target_follows_cwd_changes(tmp_path, monkeypatch):
+    from src.utils import tools
+
+    tools._resolved_path.cache_clear()
+    for d in ("a/t", "b/t"):
+        (tmp_path / d).mkdir(parents=True)
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert tools._resolve_target("t") == (tmp_path / "a" / "t").resolve()
+    monkeypatch.chdir(tmp_path / "b")
+    assert tools._resolve_target("t") == (tmp_path / "b" / "t").resolve()
+
+
+def test_resolve_target_created_later_is_resolved_again(tmp_path, monkeypatch):
+    from src.utils import tools
+
+    tools._resolved_path.cache_clear()
+    monkeypatch.chdir(tmp_path)
+
+    created = tools._resolve_target("later")
+    assert created == (tmp_path / "later").resolve() and created.is_dir()
+
+    # Replace the freshly created directory with a symlink elsewhere.
+    (tmp_path / "real").mkdir()
+    created.rmdir()
+    (tmp_path / "later").symlink_to(tmp_path / "real", target_is_directory=True)
+
+    assert tools._resolve_target("later") == (tmp_path / "real").resolve()
+
+
+def _zip_bytes():
+    import io
+    import zipfile
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("pkg/hello.txt", "hi")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def zip_server(monkeypatch, tmp_path, installer):
+    """Serve downloads through httpx.MockTransport; temp files land in tmp_path/tmp."""
+    import tempfile
+
+    import httpx
+
+    tmp_dir = tmp_path / "tmp"
+    tmp_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_dir))
+
+    routes = {}
+    real_client = httpx.Client
+    transport = httpx.MockTransport(lambda request: routes[str(request.url)]())
+    monkeypatch.setattr(installer.httpx, "Client", lambda **kw: real_client(transport=transport, **kw))
+    return routes, tmp_dir
+
+
+def test_install_zip_streams_and_checks_digest(zip_server, tmp_path, installer):
+    import hashlib
+
+    import httpx
+
+    routes, tmp_dir = zip_server
+    body = _zip_bytes()
+    # A generator body is streamed to the client in pieces.
+    routes["https://x/a.zip"] = lambda: httpx.Response(200, content=iter([body[:10], body[10:]]))
+    spec = {"url": "https://x/a.zip", "digest": "sha256:" + hashlib.sha256(body).hexdigest()}
+
+    res = installer._install_zip(spec, tmp_path / "proj")
+
+    assert res.ok, res.stderr
+    assert (tmp_path / "proj" / "vendor_zip" / "pkg" / "hello.txt").read_text() == "hi"
+    assert list(tmp_dir.iterdir()) == []
+
+
+def test_install_zip_digest_mismatch_extracts_nothing(zip_server, tmp_path, installer):
+    import httpx
+
+    routes, tmp_dir = zip_server
+    routes["https://x/a.zip"] = lambda: httpx.Response(200, content=_zip_bytes())
+
+    res = installer._install_zip({"url": "https://x/a.zip", "digest": "sha256:00"}, tmp_path / "proj")
+
+    assert not res.ok and res.stderr.startswith("digest mismatch: expected sha256:00")
+    assert list((tmp_path / "proj" / "vendor_zip").iterdir()) == []
+    assert list(tmp_dir.iterdir()) == []
+
+
+def test_install_zip_removes_temp_file_on_failure(zip_server, tmp_path, installer):
+    import httpx
+
+    routes, tmp_dir = zip_server
+    routes["https://x/a.zip"] = lambda: httpx.Response(500)
+
+    res = installer._install_zip({"url": "https://x/a.zip"}, tmp_path / "proj")
+
+    assert not res.ok and "500" in res.stderr
+    assert list(tmp_dir.iterdir()) == []
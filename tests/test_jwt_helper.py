@@ -0,0 +1,67 @@
+import pytest
+
+from src.utils import jwt_helper
+
+SECRET = "matrix-hub-test-secret-0123456789abcdef"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(jwt_helper, "_TOKEN_CACHE", {})
+
+
+def _freeze(monkeypatch, now):
+    monkeypatch.setattr(jwt_helper, "_now", lambda: now)
+
+
+def test_minted_token_decodes_with_pyjwt(monkeypatch):
+    jwt = pytest.importorskip("jwt")
+    _freeze(monkeypatch, 1_700_000_000)
+
+    token = jwt_helper.get_mcp_admin_token(secret=SECRET, username="alice", ttl_seconds=300)
+    claims = jwt.decode(
+        token, SECRET, algorithms=["HS256"], options={"verify_exp": False, "verify_iat": False}
+    )
+
+    assert claims == {"sub": "alice", "iat": 1_700_000_000, "exp": 1_700_000_300}
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+    assert token == jwt.encode(claims, SECRET, algorithm="HS256")
+
+
+def test_cached_token_is_reused(monkeypatch):
+    _freeze(monkeypatch, 1_000)
+    first = jwt_helper.get_mcp_admin_token(secret=SECRET, username="alice", ttl_seconds=300)
+
+    # Still more than _REFRESH_MARGIN_S before expiry (exp=1300).
+    _freeze(monkeypatch, 1_300 - jwt_helper._REFRESH_MARGIN_S - 1)
+    assert jwt_helper.get_mcp_admin_token(secret=SECRET, username="alice", ttl_seconds=300) == first
+
+
+def test_token_reminted_inside_refresh_margin(monkeypatch):
+    _freeze(monkeypatch, 1_000)
+    first = jwt_helper.get_mcp_admin_token(secret=SECRET, username="alice", ttl_seconds=300)
+
+    _freeze(monkeypatch, 1_300 - jwt_helper._REFRESH_MARGIN_S)
+    second = jwt_helper.get_mcp_admin_token(secret=SECRET, username="alice", ttl_seconds=300)
+
+    assert second != first
+    (entry,) = jwt_helper._TOKEN_CACHE.values()
+    assert entry == (second, 1_300 - jwt_helper._REFRESH_MARGIN_S + 300)
+
+
+def test_token_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(jwt_helper, "_TOKEN_CACHE_MAX", 2)
+    _freeze(monkeypatch, 1_000)
+    for user in ("a", "b"):
+        jwt_helper.get_mcp_admin_token(secret=SECRET, username=user, ttl_seconds=300)
+
+    # Full and nothing expired: the oldest entry makes room.
+    jwt_helper.get_mcp_admin_token(secret=SECRET, username="c", ttl_seconds=300)
+    assert [k[1] for k in jwt_helper._TOKEN_CACHE] == ["b", "c"]
+
+    # Expired entries go first, even if they are not the oldest.
+    jwt_helper.get_mcp_admin_token(secret=SECRET, username="short", ttl_seconds=10)
+    assert [k[1] for k in jwt_helper._TOKEN_CACHE] == ["c", "short"]
+    _freeze(monkeypatch, 1_100)
+    jwt_helper.get_mcp_admin_token(secret=SECRET, username="d", ttl_seconds=300)
+    assert [k[1] for k in jwt_helper._TOKEN_CACHE] == ["c", "d"]
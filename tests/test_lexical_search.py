@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert
+
+_T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _row(uid, name, summary=None, description=None, age_days=0):
+    return dict(
+        uid=uid,
+        type="tool",
+        name=name,
+        version="1.0.0",
+        summary=summary,
+        description=description,
+        created_at=_T0 - timedelta(days=age_days),
+    )
+
+
+@pytest.fixture
+def seeded(session):
+    from src.models import Entity
+
+    session.execute(
+        insert(Entity),
+        [
+            # Newest first by created_at, so recency alone would put "both" last.
+            _row("tool:pdf-only@1", "PDF reader", age_days=0),
+            _row("tool:tables-only@1", "Table helper", summary="Works on tables", age_days=1),
+            _row("tool:both@1", "PDF tables", summary="Extract tables from a PDF", age_days=2),
+            _row("tool:unrelated@1", "Calendar", age_days=3),
+        ],
+    )
+    session.flush()
+    return session
+
+
+def _search(db, q, limit=10, offset=0):
+    from src.services.search.engine import run_keyword
+
+    return run_keyword(db, q, None, True, limit, offset)
+
+
+def test_multi_word_query_matches_any_term(seeded):
+    ids = {h.entity_id for h in _search(seeded, "pdf tables")}
+    assert ids == {"tool:pdf-only@1", "tool:tables-only@1", "tool:both@1"}
+
+
+def test_more_matching_terms_rank_higher(seeded):
+    hits = _search(seeded, "pdf tables")
+    assert hits[0].entity_id == "tool:both@1"
+    assert hits[0].score > max(h.score for h in hits[1:])
+
+
+def test_offset_and_limit_paginate_ranked_results(seeded):
+    full = [h.entity_id for h in _search(seeded, "pdf tables")]
+    pages = [h.entity_id for off in (0, 1, 2) for h in _search(seeded, "pdf tables", limit=1, offset=off)]
+
+    assert pages == full
+    assert _search(seeded, "pdf tables", limit=2, offset=1)[0].entity_id == full[1]
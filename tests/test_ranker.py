@@ -0,0 +1,54 @@
+# tests/test_ranker.py
+from __future__ import annotations
+
+import pytest
+
+from src.config import settings
+from src.services.search import ranker
+from src.services.search.interfaces import Hit
+
+
+def _hit(eid, score, source, quality=0.0, recency=0.0):
+    return Hit(entity_id=eid, score=score, source=source, quality=quality, recency=recency)
+
+
+def test_merge_keeps_best_duplicate_and_averages_signals():
+    lex = [
+        _hit("a", 0.2, "lexical", quality=0.4, recency=1.0),
+        _hit("a", 0.9, "lexical", quality=0.0, recency=0.0),
+        _hit("b", 0.5, "vector"),  # wrong source: ignored
+    ]
+    vec = [_hit("a", 0.6, "vector", quality=0.8, recency=0.0)]
+
+    merged = ranker.merge_and_score(lex, vec)
+    assert [m["entity_id"] for m in merged] == ["a"]
+
+    m = merged[0]
+    w = settings.SEARCH_WEIGHTS
+    assert m["score_lexical"] == pytest.approx(0.9)
+    assert m["score_semantic"] == pytest.approx(0.6)
+    assert m["score_quality"] == pytest.approx(0.6)
+    assert m["score_recency"] == pytest.approx(0.5)
+    assert m["score_final"] == pytest.approx(
+        w.semantic * 0.6 + w.lexical * 0.9 + w.quality * 0.6 + w.recency * 0.5
+    )
+
+
+def test_merge_orders_by_final_score():
+    lex = [_hit("low", 0.1, "lexical"), _hit("high", 1.0, "lexical")]
+    merged = ranker.merge_and_score(lex, [])
+    assert [m["entity_id"] for m in merged] == ["high", "low"]
+
+
+def test_vectorized_merge_matches_scalar_path(monkeypatch):
+    pytest.importorskip("numpy")
+    lex = [_hit(f"e{i}", (i % 7) / 7.0, "lexical", quality=0.3, recency=(i % 3) / 3.0) for i in range(100)]
+    vec = [_hit(f"e{i}", (i % 5) / 5.0, "vector", quality=0.9) for i in range(0, 100, 2)]
+
+    fast = ranker.merge_and_score(lex, vec)
+    monkeypatch.setattr(ranker, "np", None)
+    slow = ranker.merge_and_score(lex, vec)
+
+    assert [m["entity_id"] for m in fast] == [m["entity_id"] for m in slow]
+    for a, b in zip(fast, slow):
+        assert a["score_final"] == pytest.approx(b["score_final"])
@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.workers import scheduler
+
+
+def _clear_resolvers():
+    scheduler._resolve_ingest_fn.cache_clear()
+    scheduler._resolve_ingest_call.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_ingest_resolution():
+    # The resolvers are lru-cached; without this a test that swaps the ingest
+    # module would keep calling whatever an earlier test resolved.
+    scheduler._get_ingest_mod.cache_clear()
+    _clear_resolvers()
+    yield
+    scheduler._get_ingest_mod.cache_clear()
+    _clear_resolvers()
+
+
+def _use_ingest_module(monkeypatch, **funcs):
+    monkeypatch.setattr(scheduler, "_get_ingest_mod", lambda: SimpleNamespace(**funcs))
+
+
+class _FakeSession:
+    closed = 0
+
+    def close(self):
+        _FakeSession.closed += 1
+
+
+def test_ingest_cycle_runs_each_remote_once(monkeypatch):
+    seen = []
+    monkeypatch.setattr(scheduler, "SessionLocal", _FakeSession)
+    monkeypatch.setattr(scheduler, "_ingest_one", lambda db, url: seen.append(url) or {"ok": True})
+    _FakeSession.closed = 0
+
+    app = SimpleNamespace(state=SimpleNamespace(remotes=["https://a/index.json", "https://b/index.json", "https://a/index.json"]))
+    scheduler._run_ingest_cycle(app)
+
+    assert sorted(seen) == ["https://a/index.json", "https://b/index.json"]
+    assert _FakeSession.closed == 2
+
+
+def test_ingest_cycle_without_remotes_is_noop(monkeypatch):
+    seen = []
+    monkeypatch.setattr(scheduler, "_ingest_one", lambda db, url: seen.append(url))
+
+    scheduler._run_ingest_cycle(SimpleNamespace(state=SimpleNamespace(remotes=[])))
+
+    assert seen == []
+
+
+def test_ingest_workers_single_on_sqlite(monkeypatch):
+    monkeypatch.setattr(scheduler.settings, "INGEST_CONCURRENCY", 8)
+
+    monkeypatch.setattr(scheduler.settings, "DATABASE_URL", "sqlite+pysqlite:///./data/catalog.sqlite")
+    assert scheduler._ingest_workers(5) == 1
+
+    monkeypatch.setattr(scheduler.settings, "DATABASE_URL", "postgresql+psycopg://u:p@db/hub")
+    assert scheduler._ingest_workers(5) == 5
+    assert scheduler._ingest_workers(20) == 8
+
+
+def test_dispatch_keyword_index_url(monkeypatch):
+    def ingest_index(db, index_url):
+        return {"db": db, "url": index_url}
+
+    _use_ingest_module(monkeypatch, ingest_index=ingest_index)
+    assert scheduler._resolve_ingest_fn()[1] == "kw2"
+    assert scheduler._ingest_one("DB", "u") == {"db": "DB", "url": "u"}
+
+
+def test_dispatch_keyword_url_and_positional(monkeypatch):
+    def ingest_remote(*, db, url):  # keyword-only: must not be called positionally
+        return {"url": url}
+
+    _use_ingest_module(monkeypatch, ingest_remote=ingest_remote)
+    assert scheduler._resolve_ingest_fn()[1] == "kw1"
+    assert scheduler._ingest_one("DB", "u") == {"url": "u"}
+
+    _clear_resolvers()
+    _use_ingest_module(monkeypatch, sync_once=lambda session, remote: {"remote": remote})
+    assert scheduler._resolve_ingest_fn()[1] == "pos"
+    assert scheduler._ingest_one("DB", "v") == {"remote": "v"}
+
+
+def test_dispatch_batch_fallback_unwraps_first_result(monkeypatch):
+    _use_ingest_module(monkeypatch, sync_all=lambda db, urls: [{"n": len(urls)}])
+    assert scheduler._ingest_one("DB", "u") == {"n": 1}
+
+    _clear_resolvers()
+    _use_ingest_module(monkeypatch, sync_all=lambda db, urls: "done")
+    assert scheduler._ingest_one("DB", "u") == {"result": "done"}
+
+
+def test_call_style_without_signature_uses_default():
+    # C callables like getattr expose no signature; keep the candidate's style.
+    assert scheduler._call_style(getattr, "kw2") == "kw2"
+    assert scheduler._call_style(getattr, "pos") == "pos"
+
+
+def test_missing_ingest_function_raises(monkeypatch):
+    _use_ingest_module(monkeypatch)
+    with pytest.raises(RuntimeError, match="No compatible ingest function"):
+        scheduler._ingest_one("DB", "u")
+
+
+def test_resolution_is_cached_until_cleared(monkeypatch):
+    _use_ingest_module(monkeypatch, ingest=lambda db, url: "old")
+    assert scheduler._ingest_one("DB", "u") == "old"
+
+    _use_ingest_module(monkeypatch, ingest=lambda db, url: "new")
+    assert scheduler._ingest_one("DB", "u") == "old"  # stale until cleared
+    _clear_resolvers()
+    assert scheduler._ingest_one("DB", "u") == "new"
+
+
+def test_background_sessionmaker_uses_its_own_unpooled_engine(tmp_path, monkeypatch):
+    from sqlalchemy import event, text
+    from sqlalchemy.pool import NullPool
+
+    from src import db
+
+    monkeypatch.setattr(db.settings, "DATABASE_URL", f"sqlite:///{tmp_path / 'bg.sqlite'}")
+    engine = db.create_background_engine()
+    try:
+        assert isinstance(engine.pool, NullPool)
+        maker = db.create_background_sessionmaker(engine)
+        assert maker.kw["bind"] is engine and maker.kw["expire_on_commit"] is False
+
+        opened, closed = [], []
+        event.listen(engine, "connect", lambda *a: opened.append(1))
+        event.listen(engine, "close", lambda *a: closed.append(1))
+        for _ in range(2):
+            with maker() as s:
+                assert s.execute(text("select 1")).scalar() == 1
+
+        # Every session opens a fresh connection and really closes it.
+        assert len(opened) == len(closed) == 2
+    finally:
+        engine.dispose()
+
+
+def test_stop_scheduler_disposes_ingest_engine(monkeypatch):
+    disposed = []
+    fake_engine = SimpleNamespace(dispose=lambda: disposed.append(True))
+    monkeypatch.setattr(scheduler, "create_background_engine", lambda: fake_engine)
+    monkeypatch.setattr(scheduler.settings, "INGEST_INTERVAL_MIN", 60)
+
+    app = SimpleNamespace(state=SimpleNamespace(scheduler=None), add_event_handler=lambda *a: None)
+    scheduler.start_scheduler(app)
+    try:
+        assert scheduler._ingest_engine is fake_engine
+        assert scheduler._IngestSession.kw["bind"] is fake_engine
+    finally:
+        scheduler.stop_scheduler(app)
+
+    assert disposed == [True]
+    assert scheduler._ingest_engine is None and scheduler._IngestSession is None
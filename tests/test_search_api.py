@@ -1,8 +1,6 @@
 # tests/test_search_api.py
 from __future__ import annotations
 
-import math
-
 import pytest
 
 pytestmark = pytest.mark.skip(reason="Requires seeded inline install — not yet wired")
@@ -20,7 +18,7 @@ def _assert_scores_not_nan(items):
             v = it.get(k, None)
             if v is not None:
                 assert isinstance(v, (int, float)), f"{k} must be a number or null, got {type(v)}"
-                assert not math.isnan(v), f"{k} is NaN (normalization bug)"
+                assert v == v, f"{k} is NaN (normalization bug)"  # NaN != NaN
 
 
 @pytest.fixture()
@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import insert
+
+from src.services.search import engine
+from src.services.search.interfaces import Hit
+
+_REGISTERED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeBackend:
+    """Stand-in for the pg_trgm backend: serves `uids` in order, at most k."""
+
+    SUPPORTS_READY_FILTER = False
+
+    def __init__(self, uids):
+        self.uids = list(uids)
+        self.calls = []
+
+    def search(self, q, filters, k, db):
+        self.calls.append(k)
+        return [Hit(entity_id=uid, score=1.0, source="lexical") for uid in self.uids[:k]]
+
+
+def _row(uid, ready=True):
+    return dict(
+        uid=uid,
+        type="tool",
+        name=uid,
+        version="1.0.0",
+        gateway_registered_at=_REGISTERED if ready else None,
+    )
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = FakeBackend([])
+    monkeypatch.setattr(engine, "pgtrgm_backend", fake)
+    return fake
+
+
+def _seed(session, rows):
+    from src.models import Entity
+
+    session.execute(insert(Entity), rows)
+    session.flush()
+
+
+def test_exact_uid_hit_skips_trigram_scan(session, backend):
+    _seed(session, [_row("tool:pdf@1.0.0")])
+
+    hits = engine.run_pgtrgm(session, "TOOL:pdf@1.0.0", None, False, 10, 0)
+
+    assert [h.entity_id for h in hits] == ["tool:pdf@1.0.0"]
+    assert backend.calls == []
+
+
+def test_uid_miss_falls_through_once(session, backend, monkeypatch):
+    probes = []
+    real = engine._fallback_uid_or_slug_hit
+    monkeypatch.setattr(
+        engine, "_fallback_uid_or_slug_hit", lambda *a: probes.append(a[1]) or real(*a)
+    )
+
+    hits = engine.run_pgtrgm(session, "tool:missing@1.0.0", None, False, 10, 0)
+
+    assert hits == []
+    assert len(backend.calls) == 1  # the trigram scan still ran
+    assert probes == ["tool:missing@1.0.0"]  # no second identical probe
+
+
+def test_short_page_after_ready_filter_widens_request(session, backend):
+    pending = [f"tool:pending-{i:02d}@1.0.0" for i in range(20)]
+    ready = [f"tool:ready-{i:02d}@1.0.0" for i in range(20)]
+    _seed(session, [_row(u, ready=False) for u in pending] + [_row(u) for u in ready])
+    backend.uids = pending + ready
+
+    hits = engine.run_pgtrgm(session, "tool", None, False, 5, 0)
+
+    assert [h.entity_id for h in hits] == ready[:5]
+    assert backend.calls == [5 + engine._READY_SLACK, 2 * (5 + engine._READY_SLACK)]
+
+
+def test_exhausted_backend_stops_widening(session, backend):
+    uids = ["tool:a@1.0.0", "tool:b@1.0.0", "tool:c@1.0.0"]
+    _seed(session, [_row(uids[0]), _row(uids[1], ready=False), _row(uids[2], ready=False)])
+    backend.uids = uids
+
+    hits = engine.run_pgtrgm(session, "tool", None, False, 5, 0)
+
+    assert [h.entity_id for h in hits] == ["tool:a@1.0.0"]
+    assert backend.calls == [5 + engine._READY_SLACK]  # len(raw) < k: nothing more to fetch
+
+
+def test_offset_pages_through_filtered_hits(session, backend):
+    uids = [f"tool:t{i}@1.0.0" for i in range(10)]
+    _seed(session, [_row(u) for u in uids])
+    backend.uids = uids
+
+    hits = engine.run_pgtrgm(session, "tool", None, False, 3, 4)
+
+    assert [h.entity_id for h in hits] == uids[4:7]
+    assert backend.calls == [3 + 4 + engine._READY_SLACK]
@@ -180,3 +180,19 @@ def test_search_against_postgres_with_drift():
     and 200 with empty results after `make repair-db`. The CI workflow
     runs this with a real Postgres service.
     """
+
+
+def test_no_duplicate_module_sources():
+    """Only one `engine.py` may define the search engine, and it must be
+    the module that actually gets imported; a stale copy elsewhere in the
+    tree could otherwise shadow the hardened version.
+    """
+    import importlib.util
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parents[1]
+    copies = [p for p in (root / "src").rglob("engine.py") if p.parent.name == "search"]
+    assert copies == [root / "src" / "services" / "search" / "engine.py"]
+
+    spec = importlib.util.find_spec("src.services.search.engine")
+    assert spec is not None and Path(spec.origin).resolve() == copies[0]
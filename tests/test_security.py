@@ -0,0 +1,60 @@
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.config import settings
+from src.utils import security
+
+
+def _request(headers=None, query=""):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": query.encode(),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    return Request(scope)
+
+
+@pytest.fixture
+def api_token(monkeypatch):
+    monkeypatch.setattr(settings, "API_TOKEN", "s3cret")
+    security._bind_settings()
+    yield "s3cret"
+    monkeypatch.undo()
+    security._bind_settings()
+
+
+def test_auth_state_is_a_snapshot_until_rebound(monkeypatch):
+    assert not security.is_auth_enabled()
+
+    monkeypatch.setattr(settings, "API_TOKEN", "s3cret")
+    assert not security.is_auth_enabled()  # not rebound yet
+    security._bind_settings()
+    assert security.is_auth_enabled()
+
+    monkeypatch.undo()
+    security._bind_settings()
+    assert not security.is_auth_enabled()
+
+
+def test_valid_token_via_header_or_query(api_token):
+    req = _request({"Authorization": f"Bearer {api_token}"})
+    security.require_api_token(req)
+    assert req.state.is_admin is True
+
+    req = _request(query=f"token={api_token}")
+    security.require_api_token(req)
+    assert req.state.is_admin is True
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Authorization": "Bearer wrong"}, {"Authorization": "Bearer s3cre"}, {"Authorization": "Bearer sécret"}],
+    ids=["missing", "wrong", "prefix", "non-ascii"],
+)
+def test_bad_tokens_are_rejected(api_token, headers):
+    with pytest.raises(HTTPException) as exc:
+        security.require_api_token(_request(headers))
+    assert exc.value.status_code == 401
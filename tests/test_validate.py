@@ -0,0 +1,178 @@
+import pytest
+
+from src.services import validate as v
+
+
+def _base(mtype, **extra):
+    m = {
+        "schema_version": 1,
+        "type": mtype,
+        "id": "demo",
+        "name": "Demo",
+        "version": "1.0.0",
+        "description": "Demo manifest.",
+        "license": "MIT",
+        "artifacts": [{"kind": "pypi", "spec": {"package": "demo", "version": "1.0.0"}}],
+    }
+    m.update(extra)
+    return m
+
+
+AGENT = _base("agent")
+TOOL = _base(
+    "tool",
+    mcp_registration={
+        "tool": {
+            "name": "demo",
+            "integration_type": "REST",
+            "request_type": "POST",
+            "url": "http://localhost:9999/invoke",
+            "input_schema": {"type": "object"},
+        }
+    },
+)
+MCP_SERVER = _base(
+    "mcp_server",
+    mcp_registration={"server": {"name": "demo", "transport": "SSE", "url": "http://localhost:8000/sse"}},
+)
+
+
+@pytest.mark.parametrize("manifest", [AGENT, TOOL, MCP_SERVER], ids=["agent", "tool", "mcp_server"])
+def test_valid_manifests_get_schema_defaults(manifest):
+    report = v.validate_manifest_with_report(manifest)
+
+    assert report.is_valid, report.errors
+    assert report.schema_id.endswith(v.SCHEMA_FILES[manifest["type"]])
+    out = report.manifest
+    assert out["capabilities"] == [] and out["tags"] == [] and out["compatibility"] == {}
+    # Defaults go into a copy; the caller's manifest is left alone.
+    assert out is not manifest and "capabilities" not in manifest
+
+
+def test_nested_defaults_applied():
+    out = v.validate_manifest(MCP_SERVER)
+    assert out["mcp_registration"]["resources"] == []
+    assert out["mcp_registration"]["prompts"] == []
+
+
+def test_invalid_manifest_reports_field_without_root_name():
+    bad = _base("agent", version="not a version")
+    report = v.validate_manifest_with_report(bad)
+
+    assert not report.is_valid
+    (err,) = report.errors
+    assert err.code == "schema_violation"
+    assert err.field == "version"
+    assert err.message.startswith("version: ") and "must match pattern" in err.message
+
+    with pytest.raises(ValueError, match=r"Manifest validation failed: version: version: .*pattern"):
+        v.validate_manifest(bad)
+
+
+def test_nested_error_path_is_dotted():
+    bad = _base("agent", artifacts=[{"kind": "pypi"}])
+    (err,) = v.validate_manifest_with_report(bad).errors
+    assert err.field == "artifacts.0"
+    assert "spec" in err.message
+
+
+def test_unknown_type_raises_value_error():
+    with pytest.raises(ValueError, match="Unknown manifest type"):
+        v.validate_manifest(_base("widget"))
+
+
+def test_nested_defaults_do_not_touch_callers_objects():
+    registration = {"server": {"name": "demo", "transport": "SSE", "url": "http://localhost:8000/sse"}}
+    manifest = _base(
+        "mcp_server",
+        capabilities=[],
+        tags=[],
+        compatibility={},
+        examples=[],
+        mcp_registration=registration,
+    )
+
+    out = v.validate_manifest(manifest)
+
+    assert out["mcp_registration"]["resources"] == []
+    assert "resources" not in registration and out is not manifest
+    assert out["compatibility"] == {"frameworks": [], "providers": []} and manifest["compatibility"] == {}
+    assert out["artifacts"] is manifest["artifacts"]  # no defaults there: shared, not copied
+
+
+def test_fully_populated_manifest_is_not_copied():
+    manifest = dict(
+        TOOL,
+        capabilities=[],
+        tags=[],
+        compatibility={"frameworks": [], "providers": []},
+        examples=[],
+    )
+    assert v.validate_manifest(manifest) is manifest
+
+
+def test_edited_schema_is_served_stale_then_reloaded(tmp_path, monkeypatch):
+    import json
+    import os
+    import time
+
+    src = v.SCHEMAS_DIR / v.SCHEMA_FILES["agent"]
+    dst = tmp_path / v.SCHEMA_FILES["agent"]
+    dst.write_bytes(src.read_bytes())
+    monkeypatch.setattr(v, "SCHEMAS_DIR", tmp_path)
+    monkeypatch.setattr(v, "_LOADED", {})
+    monkeypatch.setattr(v, "_SCHEMA_CACHE", {})
+    monkeypatch.setattr(v, "_next_mtime_check", {})
+    monkeypatch.setattr(v, "_MTIME_CHECK_INTERVAL_S", 0.0)
+
+    _, old, _ = v._load_type("agent")
+
+    schema = json.loads(dst.read_text(encoding="utf-8"))
+    schema["properties"]["tags"]["default"] = ["edited"]
+    dst.write_text(json.dumps(schema), encoding="utf-8")
+    st = dst.stat()
+    os.utime(dst, (st.st_atime, st.st_mtime + 10))
+
+    # The first call after the edit still gets the cached validator ...
+    _, first, _ = v._load_type("agent")
+    assert first is old
+
+    # ... while the recompile runs in the background.
+    deadline = time.monotonic() + 5
+    while v._LOADED["agent"][1] is old and time.monotonic() < deadline:
+        time.sleep(0.01)
+    _, new, _ = v._load_type("agent")
+    assert new is not old
+    assert v.validate_manifest(dict(AGENT))["tags"] == ["edited"]
+
+
+def test_trust_warnings_keep_signature_then_sbom_order():
+    manifest = _base(
+        "agent",
+        sbom_uri="https://example.invalid/sbom.json",
+        artifacts=[
+            {"kind": "pypi", "spec": {"package": "demo"}, "sbom_uri": "s", "sig_uri": "x"},
+            {"kind": "zip", "spec": {"url": "https://example.invalid/a.zip"}},
+        ],
+    )
+    codes = [(w.code, w.field) for w in v.validate_manifest_with_report(manifest).warnings]
+
+    assert codes == [
+        ("signature_not_verified", "artifacts[0].sig_uri"),
+        ("missing_digest", "artifacts[1].spec"),
+        ("sbom_not_scanned", "sbom_uri"),
+        ("sbom_not_scanned", "artifacts[0].sbom_uri"),
+    ]
+    assert v.check_sbom(manifest) == v.validate_manifest_with_report(manifest).warnings[2:]
+
+
+def test_failing_trust_check_is_reported_under_its_own_code(monkeypatch):
+    def boom(*args):
+        raise RuntimeError("signature backend down")
+
+    monkeypatch.setattr(v, "_signature_hints", boom)
+    manifest = _base("agent", sbom_uri="https://example.invalid/sbom.json")
+    warnings = v.validate_manifest_with_report(manifest).warnings
+
+    assert [w.code for w in warnings] == ["signature_check_error", "sbom_not_scanned"]
+    assert warnings[0].message == "signature backend down"